@@ -0,0 +1,33 @@
+"""
+Compare transliterate_text with and without the alignment.
+Usage: python benchmarks/alignment.py [size in characters ...]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from hangul_hu import Hangul  # noqa: E402
+from corpora import CORPORA  # noqa: E402
+
+
+def best(function, repeat=3):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+if __name__ == "__main__":
+    translator = Hangul()
+    translator.transliterate_text("가")
+    for size in [int(size) for size in sys.argv[1:]] or [1000000]:
+        for name in ["uniform", "mixed", "sparse"]:
+            text = CORPORA[name](size)
+            plain = best(lambda: translator.transliterate_text(text))
+            aligned = best(lambda: translator.transliterate_text(text, alignment=True))
+            print("{:>8} {:<8} plain {:6.3f} s, alignment {:6.3f} s, {:4.2f}x".format(
+                size, name, plain, aligned, aligned / plain))
@@ -0,0 +1,38 @@
+"""
+Measure the throughput of the bulk file mode with the number of worker processes.
+Usage: python benchmarks/bulk.py [size of the file in MB]
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from hangul_hu.bulk import transliterate_files  # noqa: E402
+from corpora import generate_text  # noqa: E402
+
+
+def run(files, workers):
+    start = time.perf_counter()
+    read, _ = transliterate_files(files, workers)
+    return read / 2 ** 20 / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 256
+    with tempfile.TemporaryDirectory() as directory:
+        input_path = os.path.join(directory, "input.txt")
+        # Repeat a block of text, generating the whole file would take longer than transliterating it
+        block = generate_text(1 << 24)
+        with open(input_path, mode="w", encoding="utf-8") as file:
+            for _ in range(max(1, size * 2 ** 20 // len(block.encode("utf-8")))):
+                file.write(block)
+        files = [(input_path, os.path.join(directory, "output.txt"))]
+        single = run(files, 1)
+        print("{:>3} workers: {:6.1f} MB/s".format(1, single))
+        workers = 2
+        while workers <= os.cpu_count():
+            throughput = run(files, workers)
+            print("{:>3} workers: {:6.1f} MB/s, {:4.2f}x".format(workers, throughput, throughput / single))
+            workers *= 2
@@ -0,0 +1,39 @@
+"""
+Measure the word cache on text with a Zipf-distributed vocabulary.
+Usage: python benchmarks/cache.py [number of words]
+"""
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from hangul_hu import Hangul  # noqa: E402
+from corpora import generate_zipf_text  # noqa: E402
+
+
+def run(text, cache_size):
+    translator = Hangul(cache_size=cache_size)
+    start = time.perf_counter()
+    translator.transliterate_text(text)
+    elapsed = time.perf_counter() - start
+    info = translator.cache_info()
+    # Memory still held once the transliteration is thrown away, i.e. by the cache
+    translator.cache_clear()
+    tracemalloc.start()
+    translator.transliterate_text(text)
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return elapsed, memory, info
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    text = generate_zipf_text(count)
+    baseline, _, _ = run(text, 0)
+    print("no cache:      {:6.2f} s".format(baseline))
+    for cache_size in [1024, 8192, 65536]:
+        elapsed, memory, info = run(text, cache_size)
+        print("cache {:>6}: {:6.2f} s, {:4.2f}x, hit rate {:5.1%}, {:6.2f} MB".format(
+            cache_size, elapsed, baseline / elapsed, info.hits / (info.hits + info.misses), memory / 2 ** 20))
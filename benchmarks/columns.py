@@ -0,0 +1,47 @@
+"""
+Measure transliterate_column on a column of Korean names with lots of repetition,
+against mapping Hangul.transliterate_text over the rows of a pandas Series.
+Usage: python benchmarks/columns.py [number of rows] [number of distinct names]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas  # noqa: E402
+import pyarrow  # noqa: E402
+
+from hangul_hu import Hangul  # noqa: E402
+from hangul_hu.columns import transliterate_column  # noqa: E402
+from corpora import random_word  # noqa: E402
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000000
+    distinct = int(sys.argv[2]) if len(sys.argv) > 2 else 50000
+    rng = random.Random(0)
+    names = [random_word(rng, 1) + " " + random_word(rng, 3) for _ in range(distinct)]
+    weights = [1 / rank for rank in range(1, distinct + 1)]
+    rows = rng.choices(names, weights, k=count)
+    array = pyarrow.array(rows, pyarrow.string())
+    series = pandas.Series(rows, dtype="object")
+    del rows
+
+    translator = Hangul()
+    translator.compile_tables()
+    expected, mapped = timed(series.map, translator.transliterate_text)
+    print("series.map:          {:7.2f} s".format(mapped))
+    result, elapsed = timed(transliterate_column, series, translator)
+    assert result.tolist() == expected.tolist()
+    print("pandas column:       {:7.2f} s, {:5.1f}x".format(elapsed, mapped / elapsed))
+    result, elapsed = timed(transliterate_column, array, translator)
+    assert result.to_pylist() == expected.tolist()
+    print("Arrow column:        {:7.2f} s, {:5.1f}x".format(elapsed, mapped / elapsed))
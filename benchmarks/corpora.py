@@ -0,0 +1,100 @@
+"""
+Reproducible generated corpora for the benchmarks, the same seed always gives the same text.
+"""
+import random
+
+SEPARATORS = [" "] * 8 + [", ", ". ", "\n"]
+
+
+def random_syllable(rng):
+    return chr(0xAC00 + rng.randrange(11172))
+
+
+def random_word(rng, longest=5):
+    return "".join(random_syllable(rng) for _ in range(rng.randint(1, longest)))
+
+
+def generate_text(size, seed=0):
+    """ Generate roughly size bytes of UTF-8 text made of random Hangul words, punctuation and line breaks. """
+    rng = random.Random(seed)
+    words = [random_word(rng) for _ in range(5000)]
+    parts = []
+    length = 0
+    while length < size:
+        word = rng.choice(words) + rng.choice(SEPARATORS)
+        parts.append(word)
+        length += len(word.encode("utf-8"))
+    return "".join(parts)
+
+
+def generate_zipf_text(count, vocabulary=20000, seed=0):
+    """ Generate count words drawn from a vocabulary with Zipf-distributed frequencies. """
+    rng = random.Random(seed)
+    words = [random_word(rng, 4) for _ in range(vocabulary)]
+    weights = [1 / rank for rank in range(1, vocabulary + 1)]
+    return " ".join(rng.choices(words, weights, k=count))
+
+
+def uniform(size, seed=0):
+    """ Words of uniformly random syllables, size characters. """
+    rng = random.Random(seed)
+    parts = []
+    length = 0
+    while length < size:
+        word = random_word(rng) + rng.choice(SEPARATORS)
+        parts.append(word)
+        length += len(word)
+    return "".join(parts)[:size]
+
+
+def zipf(size, seed=0):
+    """ Zipf-distributed vocabulary, size characters. """
+    # Words are 2.5 syllables and a space long on average
+    return generate_zipf_text(size // 3 + 1, seed=seed)[:size]
+
+
+def long_runs(size, seed=0):
+    """ Runs of about a thousand syllables without any break, size characters. """
+    rng = random.Random(seed)
+    parts = []
+    length = 0
+    while length < size:
+        run = "".join(random_syllable(rng) for _ in range(rng.randint(500, 1500))) + "\n"
+        parts.append(run)
+        length += len(run)
+    return "".join(parts)[:size]
+
+
+def mixed(size, seed=0):
+    """ Hangul words mixed with Latin words, digits and punctuation, size characters. """
+    rng = random.Random(seed)
+    latin = ["the", "Seoul", "K-pop", "2024", "ok", "(live)", "feat.", "OST", "-", "!?"]
+    parts = []
+    length = 0
+    while length < size:
+        word = (random_word(rng) if rng.random() < 0.5 else rng.choice(latin)) + rng.choice(SEPARATORS)
+        parts.append(word)
+        length += len(word)
+    return "".join(parts)[:size]
+
+
+def sparse(size, seed=0):
+    """ Mostly Latin text with a Korean word every few lines, size characters. """
+    rng = random.Random(seed)
+    latin = ["the", "quick", "brown", "fox", "jumps", "over", "lazy", "dog", "Seoul", "2024,", "(live)", "ok."]
+    parts = []
+    length = 0
+    while length < size:
+        word = (random_word(rng) if rng.random() < 0.02 else rng.choice(latin)) + rng.choice(SEPARATORS)
+        parts.append(word)
+        length += len(word)
+    return "".join(parts)[:size]
+
+
+CORPORA = {
+    "uniform": uniform,
+    "zipf": zipf,
+    "long_runs": long_runs,
+    "mixed": mixed,
+    "sparse": sparse,
+}
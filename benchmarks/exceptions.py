@@ -0,0 +1,60 @@
+"""
+Measure exception dictionaries of growing size against the rules alone, and against fixing the output
+with a string replace per entry (measured on the smallest dictionary only, it grows with the dictionary).
+Usage: python benchmarks/exceptions.py [size of the text in characters]
+"""
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from hangul_hu import Exceptions, Hangul  # noqa: E402
+from corpora import generate_text, random_syllable, random_word  # noqa: E402
+
+SIZES = [1000, 10000, 100000]
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def build(entries):
+    tracemalloc.start()
+    exceptions, elapsed = timed(Exceptions, entries)
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return exceptions, elapsed, memory
+
+
+def replace_all(translator, text, replacements):
+    output = translator.transliterate_text(text)
+    for old, new in replacements:
+        output = output.replace(old, new)
+    return output
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 10000000
+    text = generate_text(size)
+    rng = random.Random(1)
+    translator = Hangul()
+    # Names and irregular words of 2 to 4 syllables
+    words = list(dict.fromkeys(random_syllable(rng) + random_word(rng, 3) for _ in range(2 * max(SIZES))))[:max(SIZES)]
+    entries = {word: translator.transliterate_korean(word).upper() for word in words}
+
+    _, baseline = timed(translator.transliterate_text, text)
+    print("rules only:        {:6.2f} s".format(baseline))
+    for count in SIZES:
+        exceptions, build_time, memory = build({word: entries[word] for word in words[:count]})
+        _, elapsed = timed(Hangul(exceptions=exceptions).transliterate_text, text)
+        print("{:>6} exceptions: {:6.2f} s, {:4.2f}x the rules, built in {:5.2f} s, {:6.1f} MB".format(
+            count, elapsed, elapsed / baseline, build_time, memory / 2 ** 20))
+    count = SIZES[0]
+    replacements = [(translator.transliterate_korean(word), entries[word]) for word in words[:count]]
+    _, elapsed = timed(replace_all, translator, text, replacements)
+    print("{:>6} replaces:   {:6.2f} s, {:4.2f}x the rules".format(count, elapsed, elapsed / baseline))
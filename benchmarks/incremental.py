@@ -0,0 +1,57 @@
+"""
+Replay a typing trace (syllables typed one by one with some backspaces) in the middle of documents
+of different sizes, with IncrementalTransliteration and by transliterating the whole text after every edit.
+Usage: python benchmarks/incremental.py [document size in characters ...]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from hangul_hu import Hangul  # noqa: E402
+from hangul_hu.incremental import IncrementalTransliteration  # noqa: E402
+from corpora import mixed, random_word  # noqa: E402
+
+
+def typing_trace(offset, count, seed=0):
+    """ Return count (offset, length, text) edits typing words at offset, every tenth edit is a backspace. """
+    rng = random.Random(seed)
+    edits = []
+    for i in range(count):
+        if i % 10 == 9:
+            offset -= 1
+            edits.append((offset, 1, ""))
+        else:
+            text = random_word(rng, 1) if rng.random() < 0.8 else " "
+            edits.append((offset, 0, text))
+            offset += 1
+    return edits
+
+
+def replay_incremental(document, edits):
+    incremental = IncrementalTransliteration(document)
+    start = time.perf_counter()
+    for offset, length, text in edits:
+        incremental.edit(offset, length, text)
+    return (time.perf_counter() - start) / len(edits)
+
+
+def replay_full(document, edits):
+    translator = Hangul()
+    start = time.perf_counter()
+    for offset, length, text in edits:
+        document = document[:offset] + text + document[offset + length:]
+        translator.transliterate_text(document)
+    return (time.perf_counter() - start) / len(edits)
+
+
+if __name__ == "__main__":
+    for size in [int(size) for size in sys.argv[1:]] or [10000, 100000, 1000000]:
+        document = mixed(size)
+        edits = typing_trace(size // 2, 1000)
+        incremental = replay_incremental(document, edits)
+        full = replay_full(document, edits[:20])
+        print("{:>8} characters: incremental {:7.3f} ms per edit, full {:8.2f} ms per edit".format(
+            size, incremental * 1000, full * 1000))
@@ -0,0 +1,38 @@
+"""
+Measure the transliteration of decomposed (NFD) text, composed on the fly,
+against normalizing it to NFC first and against text which is already NFC.
+Usage: python benchmarks/jamo.py [number of characters]
+"""
+import os
+import sys
+import time
+import unicodedata
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from hangul_hu import Hangul  # noqa: E402
+from corpora import CORPORA  # noqa: E402
+
+
+def best(function, text, repeat=5):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(text)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 2000000
+    translator = Hangul()
+    translator.compile_tables()
+    print("{:<10}{:>14}{:>14}{:>14}".format("corpus", "NFC", "NFD", "NFD -> NFC"))
+    for name, generate in CORPORA.items():
+        text = generate(size)
+        decomposed = unicodedata.normalize("NFD", text)
+        assert translator.transliterate_text(decomposed) == translator.transliterate_text(text)
+        composed = best(translator.transliterate_text, text)
+        direct = best(translator.transliterate_text, decomposed)
+        normalized = best(lambda text: translator.transliterate_text(unicodedata.normalize("NFC", text)), decomposed)
+        print("{:<10}{:>12.2f} s{:>12.2f} s{:>12.2f} s".format(name, composed, direct, normalized))
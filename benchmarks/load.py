@@ -0,0 +1,97 @@
+"""
+Load generator for the transliteration service (hangul_hu.server).
+Starts a server, keeps a number of concurrent keep-alive connections sending requests
+for a while and reports the throughput and the latency percentiles seen by the clients.
+Usage: python benchmarks/load.py [--concurrency N ...] [--duration SECONDS]
+"""
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+from argparse import ArgumentParser
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from corpora import random_word  # noqa: E402
+
+
+async def client(port, texts, deadline, latencies):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    rng = random.Random()
+    try:
+        while time.perf_counter() < deadline:
+            body = json.dumps({"text": rng.choice(texts)}).encode("utf-8")
+            start = time.perf_counter()
+            writer.write("POST /transliterate HTTP/1.1\r\nHost: localhost\r\nContent-Type: application/json\r\n"
+                         "Content-Length: {}\r\n\r\n".format(len(body)).encode("latin-1") + body)
+            await writer.drain()
+            await reader.readline()
+            length = 0
+            while True:
+                line = await reader.readline()
+                if line == b"\r\n":
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                if name.lower() == "content-length":
+                    length = int(value)
+            await reader.readexactly(length)
+            latencies.append(time.perf_counter() - start)
+    finally:
+        writer.close()
+
+
+async def run(port, texts, concurrency, duration):
+    latencies = []
+    deadline = time.perf_counter() + duration
+    await asyncio.gather(*(client(port, texts, deadline, latencies) for _ in range(concurrency)))
+    latencies.sort()
+
+    def percentile(p):
+        return latencies[min(len(latencies) - 1, int(p / 100 * len(latencies)))] * 1000
+
+    print("{:>4} clients: {:8.0f} requests/s, p50 {:6.2f} ms, p99 {:6.2f} ms".format(
+        concurrency, len(latencies) / duration, percentile(50), percentile(99)))
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def main():
+    parser = ArgumentParser("Measure the latency of the transliteration service.")
+    parser.add_argument("--concurrency", nargs="+", type=int, default=[1, 8, 64])
+    parser.add_argument("--duration", type=float, default=5)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    texts = [" ".join(random_word(rng) for _ in range(rng.randint(1, 20))) for _ in range(1000)]
+    port = free_port()
+    command = [sys.executable, "-m", "hangul_hu.server", "--port", str(port)]
+    if args.workers is not None:
+        command += ["--workers", str(args.workers)]
+    server = subprocess.Popen(command, cwd=ROOT)
+    try:
+        # Wait until the server accepts connections
+        for _ in range(100):
+            try:
+                socket.create_connection(("127.0.0.1", port)).close()
+                break
+            except OSError:
+                time.sleep(0.1)
+        for concurrency in args.concurrency:
+            asyncio.run(run(port, texts, concurrency, args.duration))
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    main()
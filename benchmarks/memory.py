@@ -0,0 +1,68 @@
+"""
+Measure the memory and the number of allocations of a million syllables in the different representations,
+and the allocations made by transliterate_text.
+Usage: python benchmarks/memory.py [number of syllables]
+"""
+import os
+import random
+import sys
+import tracemalloc
+from array import array
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from hangul_hu import Hangul, Syllable  # noqa: E402
+from corpora import uniform  # noqa: E402
+
+
+def measure(build):
+    """ Return the memory held by the result of build and the number of blocks it allocated. """
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    result = build()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    statistics = after.compare_to(before, "filename")
+    size = sum(statistic.size_diff for statistic in statistics)
+    blocks = sum(statistic.count_diff for statistic in statistics)
+    del result
+    return size, blocks
+
+
+def syllables(indices):
+    return [Syllable(Hangul.JLT[l], Hangul.JVT[v], Hangul.JTT_MERGED[t] if t != 0 else None) for l, v, t in indices]
+
+
+def packed(indices):
+    word = array("H")
+    for syllable in indices:
+        word.extend(syllable)
+    return word
+
+
+def peak(function, argument):
+    """ Return the peak memory allocated during a call. """
+    tracemalloc.start()
+    function(argument)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    rng = random.Random(0)
+    indices = [(rng.randrange(Hangul.LCount), rng.randrange(Hangul.VCount), rng.randrange(Hangul.TCount))
+               for _ in range(count)]
+    scale = 1000000 / count
+    for name, build in [("Syllable objects", lambda: syllables(indices)),
+                        ("index tuples", lambda: [(l, v, t) for l, v, t in indices]),
+                        ("array('H')", lambda: packed(indices))]:
+        size, blocks = measure(build)
+        print("{:<18} {:8.2f} MB, {:>10,.0f} allocations per million syllables".format(
+            name, size * scale / 2 ** 20, blocks * scale))
+    translator = Hangul()
+    translator.transliterate_text("가")
+    text = uniform(count)
+    print("transliterate_text peak: {:.2f} MB per million characters".format(
+        peak(translator.transliterate_text, text) * scale / 2 ** 20))
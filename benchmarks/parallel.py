@@ -0,0 +1,40 @@
+"""
+Measure how transliterate_many scales with the number of worker processes and threads.
+Threads only scale on free-threaded Python builds (e.g. python3.13t), run the benchmark with both interpreters.
+Usage: python benchmarks/parallel.py [number of lines] [maximum number of workers]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from hangul_hu import Hangul, transliterate_many  # noqa: E402
+from hangul_hu.parallel import BACKENDS  # noqa: E402
+from corpora import generate_text  # noqa: E402
+
+
+def run(lines, workers, backend):
+    start = time.perf_counter()
+    for _ in transliterate_many(lines, workers=workers, chunksize=256, backend=backend):
+        pass
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    maximum = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count()
+    # sys._is_gil_enabled only exists since Python 3.13
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print("Python {}, GIL {}".format(sys.version.split()[0], "enabled" if gil else "disabled"))
+    lines = generate_text(count * 40).splitlines(keepends=True)[:count]
+    # Threads share the tables of this process, they are compiled before the timings
+    Hangul.compile_tables()
+    single = run(lines, 1, "processes")
+    print("{:>3} worker:     {:6.2f} s".format(1, single))
+    for backend in BACKENDS:
+        workers = 2
+        while workers <= maximum:
+            elapsed = run(lines, workers, backend)
+            print("{:>3} {:<9}: {:6.2f} s, {:4.2f}x".format(workers, backend, elapsed, single / elapsed))
+            workers *= 2
@@ -0,0 +1,67 @@
+"""
+Measure the build rate and the query latency of the search index on a synthetic corpus.
+Usage: python benchmarks/search.py [number of documents]
+"""
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from hangul_hu import Hangul  # noqa: E402
+from hangul_hu.index import SearchIndex  # noqa: E402
+from corpora import generate_zipf_text  # noqa: E402
+
+WORDS_PER_DOCUMENT = 8
+FLUSH_EVERY = 100000
+QUERIES = 200
+
+
+def latency(query, tokens):
+    times = []
+    for token in tokens:
+        start = time.perf_counter()
+        query(token)
+        times.append(time.perf_counter() - start)
+    times.sort()
+    return statistics.median(times) * 1000, times[int(len(times) * 0.99)] * 1000
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    words = generate_zipf_text(count * WORDS_PER_DOCUMENT).split(" ")
+    documents = [" ".join(words[i:i + WORDS_PER_DOCUMENT]) for i in range(0, len(words), WORDS_PER_DOCUMENT)]
+    vocabulary = sorted(set(words))
+    del words
+    with tempfile.TemporaryDirectory() as directory:
+        index = SearchIndex(directory)
+        start = time.perf_counter()
+        for document, text in enumerate(documents):
+            index.add(document, text)
+            if (document + 1) % FLUSH_EVERY == 0:
+                index.flush()
+        index.flush()
+        built = time.perf_counter() - start
+        segments = len(index.segments)
+        index.compact()
+        compacted = time.perf_counter() - start - built
+        index.close()
+        size = sum(os.path.getsize(os.path.join(directory, name)) for name in os.listdir(directory))
+        print("build: {:8.0f} documents/s, {} segments, compact {:.2f} s, {:.1f} MB".format(
+            len(documents) / built, segments, compacted, size / 2 ** 20))
+
+        # Queries on a freshly opened index, the postings are only read when needed
+        index = SearchIndex(directory)
+        translator = Hangul()
+        rng = random.Random(0)
+        tokens = [translator.transliterate_korean(word).lower() for word in rng.sample(vocabulary, QUERIES)]
+        for name, query in [("lookup", index.lookup),
+                            ("prefix", lambda token: index.prefix(token[:3])),
+                            ("fuzzy 1", index.fuzzy),
+                            ("fuzzy 2", lambda token: index.fuzzy(token, 2))]:
+            median, worst = latency(query, tokens)
+            print("{:8}: median {:8.3f} ms, p99 {:8.3f} ms".format(name, median, worst))
+        index.close()
@@ -0,0 +1,34 @@
+"""
+Measure the command line with and without a store file on short inputs.
+Usage: python benchmarks/startup.py [number of runs]
+"""
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from hangul_hu import Hangul  # noqa: E402
+from corpora import generate_zipf_text  # noqa: E402
+
+SCRIPT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Transliterator.py")
+
+
+def run(runs, words, options):
+    start = time.perf_counter()
+    for i in range(runs):
+        subprocess.run([sys.executable, SCRIPT, words[i % len(words)]] + options, check=True, stdout=subprocess.DEVNULL)
+    return (time.perf_counter() - start) / runs
+
+
+if __name__ == "__main__":
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    words = sorted(set(generate_zipf_text(100000).split(" ")))
+    with tempfile.TemporaryDirectory() as directory:
+        store = os.path.join(directory, "store.bin")
+        Hangul().save_store(store, words)
+        print("store: {} words, {:.2f} MB".format(len(words), os.path.getsize(store) / 2 ** 20))
+        print("without store: {:6.1f} ms per run".format(run(runs, words, []) * 1000))
+        print("with store:    {:6.1f} ms per run".format(run(runs, words, ["--store", store]) * 1000))
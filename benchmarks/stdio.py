@@ -0,0 +1,73 @@
+"""
+Compare starting Transliterator.py for every text with one co-process answering JSON Lines requests
+(--serve-stdio), one request at a time and pipelined.
+Usage: python benchmarks/stdio.py [number of requests]
+"""
+import json
+import os
+import random
+import subprocess
+import sys
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRIPT = os.path.join(ROOT, "Transliterator.py")
+
+from corpora import random_word  # noqa: E402
+
+# Starting a process per text is slow, it is measured on fewer texts
+CALLS = 50
+
+
+def per_call(texts):
+    start = time.perf_counter()
+    for text in texts:
+        subprocess.run([sys.executable, SCRIPT, text], check=True, stdout=subprocess.DEVNULL)
+    return len(texts) / (time.perf_counter() - start)
+
+
+def requests(texts):
+    return [(json.dumps({"id": i, "text": text}, ensure_ascii=False) + "\n").encode("utf-8")
+            for i, text in enumerate(texts)]
+
+
+def round_trips(texts):
+    start = time.perf_counter()
+    process = subprocess.Popen([sys.executable, SCRIPT, "--serve-stdio"], stdin=subprocess.PIPE,
+                               stdout=subprocess.PIPE)
+    for request in requests(texts):
+        process.stdin.write(request)
+        process.stdin.flush()
+        process.stdout.readline()
+    process.stdin.close()
+    process.wait()
+    return len(texts) / (time.perf_counter() - start)
+
+
+def pipelined(texts):
+    start = time.perf_counter()
+    process = subprocess.Popen([sys.executable, SCRIPT, "--serve-stdio"], stdin=subprocess.PIPE,
+                               stdout=subprocess.PIPE)
+
+    def send():
+        for request in requests(texts):
+            process.stdin.write(request)
+        process.stdin.close()
+
+    sender = threading.Thread(target=send)
+    sender.start()
+    answers = sum(1 for _ in process.stdout)
+    sender.join()
+    process.wait()
+    assert answers == len(texts)
+    return len(texts) / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    rng = random.Random(0)
+    texts = [" ".join(random_word(rng) for _ in range(rng.randint(1, 4))) for _ in range(count)]
+    print("process per text:   {:10.1f} texts/s".format(per_call(texts[:CALLS])))
+    print("co-process, 1 by 1: {:10.1f} texts/s".format(round_trips(texts)))
+    print("co-process, piped:  {:10.1f} texts/s".format(pipelined(texts)))
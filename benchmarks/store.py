@@ -0,0 +1,38 @@
+"""
+Measure transliterate_text with and without a store file, on text whose words are in the store
+and on text from another seed, whose rare words are mostly not (see startup.py for the startup time).
+Usage: python benchmarks/store.py [number of words]
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from hangul_hu import Hangul  # noqa: E402
+from corpora import generate_zipf_text  # noqa: E402
+
+
+def run(translator, text):
+    start = time.perf_counter()
+    translator.transliterate_text(text)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 300000
+    words = sorted(set(generate_zipf_text(100000).split(" ")))
+    texts = {"stored words": generate_zipf_text(count), "other seed": generate_zipf_text(count, seed=1)}
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "store.bin")
+        Hangul().save_store(path, words)
+        print("store: {} words, {:.2f} MB".format(len(words), os.path.getsize(path) / 2 ** 20))
+        for name, text in texts.items():
+            baseline = run(Hangul(), text)
+            translator = Hangul(store=path)
+            # The first lookup reads the words of the store
+            translator.transliterate_text(text[:100])
+            elapsed = run(translator, text)
+            print("{:<13} without store: {:6.2f} s, with store: {:6.2f} s, {:4.2f}x".format(
+                name + ":", baseline, elapsed, baseline / elapsed))
@@ -0,0 +1,116 @@
+"""
+Benchmark transliterate_text, transliterate_word and syllables_to_characters on the generated corpora.
+Usage: python benchmarks/suite.py [--sizes N ...] [--save] [--tolerance T]
+The throughput is compared with the one stored in baseline.json, a benchmark slower than the baseline
+by more than the tolerance is reported as a regression and makes the script exit with 1.
+--save stores the current results as the new baseline (baselines only make sense on the same machine).
+"""
+import json
+import os
+import re
+import sys
+import time
+import tracemalloc
+from argparse import ArgumentParser
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from hangul_hu import Hangul, Syllable  # noqa: E402
+from corpora import CORPORA  # noqa: E402
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+KOREAN_RUN = re.compile("[가-힣]+")
+
+
+def korean_words(text):
+    """ Split the Korean parts of a text into lists of Syllable objects for transliterate_word. """
+    words = []
+    for run in KOREAN_RUN.findall(text):
+        word = []
+        for character in run:
+            SIndex = ord(character) - Hangul.SBase
+            l = SIndex // Hangul.NCount
+            v = (SIndex % Hangul.NCount) // Hangul.TCount
+            t = SIndex % Hangul.TCount
+            word.append(Syllable(Hangul.JLT[l], Hangul.JVT[v], Hangul.JTT_MERGED[t] if t != 0 else None))
+        words.append(word)
+    return words
+
+
+def transliterate_words(words):
+    for word in words:
+        Hangul.transliterate_word(word)
+
+
+def benchmarks(text):
+    """ Return the benchmarked functions with their prepared argument. """
+    translator = Hangul()
+    return {
+        "transliterate_text": (translator.transliterate_text, text),
+        "transliterate_word": (transliterate_words, korean_words(text)),
+        "syllables_to_characters": (translator.syllables_to_characters, text),
+    }
+
+
+def measure(function, argument, repeat):
+    """ Return the best time out of repeat runs and the peak memory allocated by a run. """
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(argument)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    # Tracing slows the run down, so the memory is measured separately
+    tracemalloc.start()
+    function(argument)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best, peak
+
+
+def main():
+    parser = ArgumentParser("Benchmark the transliteration on generated corpora.")
+    parser.add_argument("--sizes", nargs="+", type=int, default=[100000, 1000000], help="Corpus sizes in characters.")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of timed runs, the best one is kept.")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed slowdown compared to the baseline.")
+    parser.add_argument("--save", action="store_true", help="Save the results as the new baseline.")
+    args = parser.parse_args()
+
+    baseline = {}
+    if os.path.exists(BASELINE):
+        with open(BASELINE, mode="r", encoding="utf-8") as file:
+            baseline = json.load(file)
+    # Warm up the rule tables
+    Hangul().transliterate_text("가")
+
+    results = {}
+    regressions = []
+    print("{:<40} {:>14} {:>10} {:>10}".format("benchmark", "syllables/s", "peak MB", "baseline"))
+    for corpus, generate in CORPORA.items():
+        for size in args.sizes:
+            text = generate(size)
+            syllables = sum(len(run) for run in KOREAN_RUN.findall(text))
+            for name, (function, argument) in benchmarks(text).items():
+                elapsed, peak = measure(function, argument, args.repeat)
+                key = "{}/{}/{}".format(corpus, size, name)
+                results[key] = {"syllables_per_second": syllables / elapsed, "peak_memory": peak}
+                comparison = ""
+                if key in baseline:
+                    ratio = results[key]["syllables_per_second"] / baseline[key]["syllables_per_second"]
+                    comparison = "{:+.1%}".format(ratio - 1)
+                    if ratio < 1 - args.tolerance:
+                        regressions.append(key)
+                print("{:<40} {:>14,.0f} {:>10.2f} {:>10}".format(
+                    key, results[key]["syllables_per_second"], peak / 2 ** 20, comparison))
+
+    if args.save:
+        with open(BASELINE, mode="w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2, sort_keys=True)
+        print("Baseline saved to {}".format(BASELINE))
+    if regressions:
+        print("Regressions: {}".format(", ".join(regressions)))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
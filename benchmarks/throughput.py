@@ -0,0 +1,31 @@
+"""
+Measure the throughput of the command line transliteration on generated Korean text.
+Usage: python benchmarks/throughput.py [size in MB ...]
+"""
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from corpora import generate_text
+
+SCRIPT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Transliterator.py")
+
+
+def run(size_mb):
+    with tempfile.TemporaryDirectory() as directory:
+        input_name = os.path.join(directory, "input.txt")
+        output_name = os.path.join(directory, "output.txt")
+        with open(input_name, mode="w", encoding="utf-8") as file:
+            file.write(generate_text(size_mb * 1024 * 1024))
+        start = time.perf_counter()
+        subprocess.run([sys.executable, SCRIPT, "-i", input_name, "-o", output_name],
+                       check=True, stdout=subprocess.DEVNULL)
+        elapsed = time.perf_counter() - start
+    print("{:>5} MB: {:8.2f} s, {:6.2f} MB/s".format(size_mb, elapsed, size_mb / elapsed))
+
+
+if __name__ == "__main__":
+    for size in sys.argv[1:] or ["1", "10", "100"]:
+        run(int(size))
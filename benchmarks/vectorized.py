@@ -0,0 +1,29 @@
+"""
+Compare the NumPy implementation of transliterate_text with the pure Python one.
+Usage: python benchmarks/vectorized.py [size in MB ...]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from hangul_hu import Hangul, vectorized  # noqa: E402
+from corpora import generate_text  # noqa: E402
+
+
+def measure(function, text):
+    start = time.perf_counter()
+    function(text)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    if vectorized.numpy is None:
+        sys.exit("NumPy is not installed")
+    translator = Hangul()
+    for size in sys.argv[1:] or ["1", "10"]:
+        text = generate_text(int(size) * 1024 * 1024)
+        python = measure(translator.transliterate_text, text)
+        numpy = measure(lambda text: vectorized.transliterate_text(text, translator), text)
+        print("{:>4} MB: python {:6.2f} s, numpy {:6.2f} s, {:4.2f}x".format(size, python, numpy, python / numpy))
@@ -0,0 +1,38 @@
+"""
+Hungarian transliteration of Korean (Hangul) text.
+The lookup tables are built on first use, importing the package does no work.
+The names of the modules pulling in multiprocessing, sockets or memory maps are imported on first use.
+"""
+from .syllable import Syllable, Complex
+from .hangul import Hangul
+from .alignment import Alignment
+from .exceptions import Exceptions
+
+__all__ = ["Syllable", "Complex", "Hangul", "Alignment", "transliterate", "transliterate_many", "IncrementalTransliteration",
+           "SearchIndex", "Scheme", "get_scheme", "Exceptions"]
+
+# Name -> module it is imported from on first use
+LAZY = {"transliterate_many": "parallel",
+        "IncrementalTransliteration": "incremental",
+        "SearchIndex": "index",
+        "Scheme": "schemes",
+        "get_scheme": "schemes"}
+
+
+def __getattr__(name):
+    if name not in LAZY:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+    import importlib
+    value = getattr(importlib.import_module("." + LAZY[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(LAZY))
+
+
+def transliterate(text, transition_table=False, scheme=None):
+    """ Transliterate a block of text, scheme is a scheme or the name of one (see schemes). """
+    from .schemes import get_scheme
+    return get_scheme(scheme).translator(transition_table).transliterate_text(text)
@@ -0,0 +1,41 @@
+import bisect
+
+
+class Alignment:
+    """
+    Mapping between the offsets of a text and the offsets of its transliteration.
+    Both are cut into the same segments, sources[i] and outputs[i] being where the i-th segment starts
+    in the text and in the transliteration (the last entries are the lengths).
+    A segment is either a text copied as it is, whose characters map one to one (copied[i] is 1),
+    or a Korean syllable or an entry of the exception dictionary, which maps as a whole
+    (e.g. the jamos of a decomposed syllable all map to its transliteration).
+    """
+    __slots__ = ("sources", "outputs", "copied")
+
+    def __init__(self, sources, outputs, copied):
+        self.sources = sources
+        self.outputs = outputs
+        self.copied = copied
+
+    def whole(self, i):
+        """ Whether the i-th segment maps as a whole. """
+        return not self.copied[i]
+
+    def output_span(self, offset):
+        """ Return the start and the end of the transliteration of the character at offset. """
+        i = bisect.bisect_right(self.sources, offset) - 1
+        if not 0 <= i < len(self.sources) - 1:
+            raise IndexError("{} is outside of the text".format(offset))
+        if self.whole(i):
+            return self.outputs[i], self.outputs[i + 1]
+        start = self.outputs[i] + offset - self.sources[i]
+        return start, start + 1
+
+    def source_offset(self, offset):
+        """ Return the offset of the character (e.g. the Korean syllable) of the text an output character comes from. """
+        i = bisect.bisect_right(self.outputs, offset) - 1
+        if not 0 <= i < len(self.outputs) - 1:
+            raise IndexError("{} is outside of the transliteration".format(offset))
+        if self.whole(i):
+            return self.sources[i]
+        return self.sources[i] + offset - self.outputs[i]
@@ -0,0 +1,93 @@
+"""
+Transliteration of large files: the input is memory-mapped and cut into chunks at whitespace,
+which is never inside a Korean word, the chunks are transliterated in worker processes
+and written into the output file in their order.
+"""
+import mmap
+import multiprocessing
+import os
+import re
+
+from . import parallel
+from .schemes import get_scheme
+
+# Number of bytes transliterated at once by a worker
+CHUNK_SIZE = 1 << 22
+WHITESPACE = re.compile(rb"\s")
+
+
+def split(buffer, chunk_size=CHUNK_SIZE):
+    """ Return the (start, end) byte ranges of the chunks of a UTF-8 buffer, every chunk but the last ends with whitespace. """
+    ranges = []
+    start = 0
+    while len(buffer) - start > chunk_size:
+        match = WHITESPACE.search(buffer, start + chunk_size - 1)
+        if match is None:
+            break
+        ranges.append((start, match.end()))
+        start = match.end()
+    if start < len(buffer):
+        ranges.append((start, len(buffer)))
+    return ranges
+
+
+def file_ranges(path, chunk_size=CHUNK_SIZE):
+    """ Return the chunks of a file, see split. """
+    if os.path.getsize(path) == 0:
+        # Empty files cannot be mapped
+        return []
+    with open(path, mode="rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        return split(buffer, chunk_size)
+
+
+def _transliterate_range(task):
+    path, start, end = task
+    with open(path, mode="rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        text = buffer[start:end].decode("utf-8")
+    return parallel._translator.transliterate_text(text).encode("utf-8")
+
+
+def transliterate_files(files, workers=None, chunk_size=CHUNK_SIZE, transition_table=False, cache_size=0, scheme=None,
+                        exceptions=None):
+    """
+    Transliterate the (input path, output path) pairs of files in a pool of worker processes,
+    the chunks of all the files are shared out among the same workers. workers defaults to the number of CPUs.
+    scheme is a scheme or the name of one (see schemes.get_scheme), exceptions an exception dictionary
+    or the path of one (see exceptions.Exceptions).
+    Return the number of bytes read and written.
+    """
+    plan = []
+    tasks = []
+    for input_path, output_path in files:
+        ranges = file_ranges(input_path, chunk_size)
+        plan.append((output_path, len(ranges)))
+        tasks.extend((input_path, start, end) for start, end in ranges)
+
+    options = (transition_table, cache_size, get_scheme(scheme).to_dict(), (), exceptions)
+    if workers == 1:
+        parallel._initialize(*options)
+        _write(plan, map(_transliterate_range, tasks))
+    else:
+        with multiprocessing.Pool(workers, initializer=parallel._initialize, initargs=options) as pool:
+            _write(plan, pool.imap(_transliterate_range, tasks))
+    return (sum(end - start for _, start, end in tasks),
+            sum(os.path.getsize(output_path) for output_path, _ in plan))
+
+
+def _write(plan, transliterations):
+    """ Write the transliterated chunks, which arrive in the order of the plan, into their output files. """
+    for output_path, count in plan:
+        with open(output_path, mode="wb") as file:
+            for _ in range(count):
+                file.write(next(transliterations))
+
+
+def directory_files(input_directory, output_directory):
+    """ Pair every file under input_directory with its path under output_directory, creating the directories. """
+    files = []
+    for directory, directories, names in os.walk(input_directory):
+        directories.sort()
+        target = os.path.join(output_directory, os.path.relpath(directory, input_directory))
+        os.makedirs(target, exist_ok=True)
+        files.extend((os.path.join(directory, name), os.path.join(target, name)) for name in sorted(names))
+    return files
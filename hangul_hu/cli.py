@@ -0,0 +1,174 @@
+import io
+import os
+import sys
+import time
+from argparse import ArgumentParser
+
+from .exceptions import Exceptions
+from .schemes import SCHEMES, get_scheme
+
+# The modules of --jobs, --bulk, --serve-stdio and --profile (and multiprocessing, json...) are only imported
+# when they are used, the command line may be started for every short text
+
+# Number of characters read from the input at once
+CHUNK_SIZE = 1 << 16
+
+
+def read_chunks(file):
+    """ Read a file chunk by chunk until its end. """
+    return iter(lambda: file.read(CHUNK_SIZE), "")
+
+
+def read_blocks(file):
+    """ Read a file in blocks of whole lines of about CHUNK_SIZE characters. """
+    block = []
+    size = 0
+    for line in file:
+        block.append(line)
+        size += len(line)
+        if size >= CHUNK_SIZE:
+            yield "".join(block)
+            block = []
+            size = 0
+    if block:
+        yield "".join(block)
+
+
+def main(argv=None):
+    """ Run the command line interface. """
+    parser = ArgumentParser("With the help of this script you can transliterate Hangul text into Hungarian.")
+    parser.add_argument('string', nargs='?', help="Text that the user wants to translate.", default=None)
+    parser.add_argument("-i", "--input", nargs=1, metavar="input", help="Load a file (- for the standard input).")
+    parser.add_argument("-o", "--output", nargs=1, metavar="output",
+                        help="Create a new file with the transliteration (- for the standard output).")
+    parser.add_argument("-d", "--display", action="store_true",
+                        help="Whether the user wants to display the transliteration in the console")
+    parser.add_argument("-j", "--jobs", type=int, default=1, metavar="N",
+                        help="Transliterate the input file in N processes.")
+    parser.add_argument("--threads", action="store_true",
+                        help="Use N threads instead of processes for --jobs, which run in parallel on free-threaded Python.")
+    parser.add_argument("-s", "--store", nargs=1, metavar="store",
+                        help="Load the rule tables and frequent words from a store file.")
+    parser.add_argument("-b", "--bulk", action="store_true",
+                        help="Memory-map the input file and transliterate it in chunks in the --jobs processes "
+                             "straight into the output file.")
+    parser.add_argument("-r", "--recursive", action="store_true",
+                        help="Transliterate every file of the input directory into the output directory (implies --bulk).")
+    parser.add_argument("--scheme", default=None, metavar="scheme",
+                        help="Transliteration scheme, one of {} or a JSON file (see schemes).".format(", ".join(SCHEMES)))
+    parser.add_argument("--exceptions", nargs=1, metavar="exceptions",
+                        help="Transliterate the words of an exception dictionary file as given in it (see exceptions).")
+    parser.add_argument("--serve-stdio", action="store_true",
+                        help="Answer JSON Lines requests on the standard input until it ends (see stdio).")
+    parser.add_argument("-p", "--profile", action="store_true",
+                        help="Count the rules and time the stages of the transliteration and print the report.")
+    parser.add_argument("--profile-json", nargs=1, metavar="report",
+                        help="Save the report of --profile as JSON into a file (implies --profile).")
+
+    args = parser.parse_args(argv)
+    args.profile = args.profile or args.profile_json is not None
+
+    if args.serve_stdio and (args.string is not None or args.input is not None or args.output is not None):
+        parser.error("In co-process mode the requests are read from the standard input.")
+    if args.profile and args.jobs > 1:
+        parser.error("The transliteration can only be profiled in a single process.")
+    try:
+        scheme = get_scheme(args.scheme)
+    except (ValueError, KeyError, OSError) as error:
+        parser.error("Can not load the scheme: {}".format(error))
+    try:
+        exceptions = Exceptions.load(args.exceptions[0]) if args.exceptions is not None else None
+    except (ValueError, OSError) as error:
+        parser.error("Can not load the exceptions: {}".format(error))
+    if args.profile:
+        from .profiling import Profile
+        profile = Profile(scheme.engine)
+    else:
+        profile = None
+    # A co-process sees the same words again and again
+    try:
+        translator = scheme.translator(cache_size=65536 if args.serve_stdio else 0,
+                                       store=args.store[0] if args.store is not None else None, profile=profile,
+                                       exceptions=exceptions)
+    except (ValueError, OSError) as error:
+        parser.error("Can not load the store: {}".format(error))
+
+    if args.serve_stdio:
+        from .stdio import StdioServer
+        StdioServer(translator).serve()
+
+    if args.string is not None:
+        print(translator.transliterate_text(args.string))
+
+    if args.output is not None and args.input is None:
+        parser.error("Input wasn't provided even though output was.")
+    if args.jobs < 1:
+        parser.error("The number of jobs must be at least 1.")
+    elif args.bulk or args.recursive:
+        if args.input is None or args.output is None or "-" in (args.input[0], args.output[0]):
+            parser.error("Bulk mode needs an input and an output path.")
+        if args.profile:
+            parser.error("The transliteration can not be profiled in bulk mode.")
+        if args.threads:
+            parser.error("Bulk mode only runs in processes.")
+        if args.recursive and not os.path.isdir(args.input[0]):
+            parser.error("{} is not a directory.".format(args.input[0]))
+        from .bulk import directory_files, transliterate_files
+        if args.recursive:
+            files = directory_files(args.input[0], args.output[0])
+        else:
+            files = [(args.input[0], args.output[0])]
+        start = time.perf_counter()
+        read, written = transliterate_files(files, args.jobs, scheme=scheme, exceptions=exceptions)
+        elapsed = time.perf_counter() - start
+        print("Transliterated {} files, {:.1f} MB in {:.2f} s ({:.1f} MB/s), wrote {:.1f} MB".format(
+            len(files), read / 2 ** 20, elapsed, read / 2 ** 20 / max(elapsed, 1e-9), written / 2 ** 20))
+    elif args.input is not None:
+        # "-" stands for the standard input and output
+        input_name = args.input[0]
+        output_name = args.output[0] if args.output is not None else None
+        # The standard streams are read and written in UTF-8 like the files, whatever the locale
+        if input_name == "-":
+            input_file = io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8")
+        else:
+            input_file = open(input_name, mode="r", encoding="utf-8")
+        if output_name is None:
+            output_file = None
+        elif output_name == "-":
+            output_file = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8")
+        else:
+            output_file = open(output_name, mode="w", encoding="utf-8")
+        if args.jobs > 1:
+            from .parallel import transliterate_many
+            # Blocks end with a line break, so no Korean word is split between two blocks
+            transliterations = transliterate_many(read_blocks(input_file), args.jobs, scheme=scheme,
+                                                  backend="threads" if args.threads else "processes",
+                                                  exceptions=exceptions)
+        else:
+            transliterations = translator.transliterate_stream(read_chunks(input_file))
+        try:
+            for transliteration in transliterations:
+                if args.display and output_name != "-":
+                    sys.stdout.write(transliteration)
+                if output_file is not None:
+                    output_file.write(transliteration)
+        finally:
+            # The wrappers of the standard streams are not closed, that would close the streams themselves
+            if input_name != "-":
+                input_file.close()
+            if output_name == "-":
+                output_file.flush()
+            elif output_file is not None:
+                output_file.close()
+        # The output is written as it is, only the text displayed next to it ends with a line break
+        if args.display and output_name != "-":
+            print()
+        if output_file is not None and output_name != "-":
+            print("Successfully saved to: {}".format(os.getcwd() + "\\" + output_name))
+
+    if profile is not None:
+        sys.stderr.write(profile.format_report() + "\n")
+        if args.profile_json is not None:
+            import json
+            with open(args.profile_json[0], mode="w", encoding="utf-8") as file:
+                json.dump(profile.report(), file, ensure_ascii=False, indent=2)
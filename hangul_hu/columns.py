@@ -0,0 +1,78 @@
+"""
+Transliteration of columns of strings (Arrow arrays and pandas Series) with lots of repeated values.
+The column is factorized into its distinct values and their codes, only the distinct values are
+transliterated and the output column is built from the codes by Arrow (pandas), so there is no
+Python work per row. pyarrow and pandas are optional, only the one of the column is needed.
+"""
+try:
+    import pyarrow
+    import pyarrow.compute
+except ImportError:
+    pyarrow = None
+try:
+    import numpy
+    import pandas
+except ImportError:
+    pandas = None
+
+from .hangul import Hangul
+
+
+def _transliterate_values(values, translator, memo):
+    """ Transliterate distinct values, memo keeps the transliterations between the chunks of a column. """
+    transliterations = []
+    for value in values:
+        if value is None:
+            transliterations.append(None)
+            continue
+        transliteration = memo.get(value)
+        if transliteration is None:
+            transliteration = memo[value] = translator.transliterate_text(value)
+        transliterations.append(transliteration)
+    return transliterations
+
+
+def _transliterate_arrow(array, translator, memo):
+    if not (pyarrow.types.is_string(array.type) or pyarrow.types.is_large_string(array.type)):
+        raise TypeError("Only string columns can be transliterated, not {}".format(array.type))
+    encoded = pyarrow.compute.dictionary_encode(array)
+    dictionary = pyarrow.array(_transliterate_values(encoded.dictionary.to_pylist(), translator, memo), array.type)
+    # Null codes give null values
+    return dictionary.take(encoded.indices)
+
+
+def _transliterate_categorical(column, translator, memo):
+    """ Transliterate the categories of a categorical Series, categories with the same transliteration are merged. """
+    categories = _transliterate_values(column.cat.categories.tolist(), translator, memo)
+    if len(set(categories)) == len(categories):
+        return column.cat.rename_categories(categories)
+    merged = list(dict.fromkeys(categories))
+    positions = {category: i for i, category in enumerate(merged)}
+    # The code of missing values is -1, which takes the -1 at the end
+    mapping = numpy.array([positions[category] for category in categories] + [-1])
+    values = pandas.Categorical.from_codes(mapping.take(column.cat.codes.to_numpy()), merged, column.cat.ordered)
+    return pandas.Series(values, index=column.index, name=column.name)
+
+
+def transliterate_column(column, translator=None):
+    """
+    Transliterate every string of a column, which is a pyarrow Array or ChunkedArray, a pandas Series or
+    any other sequence of strings, and return a column of the same kind. Missing values stay missing.
+    """
+    if translator is None:
+        translator = Hangul()
+    memo = {}
+    if pyarrow is not None and isinstance(column, pyarrow.ChunkedArray):
+        return pyarrow.chunked_array([_transliterate_arrow(chunk, translator, memo) for chunk in column.chunks],
+                                     column.type)
+    if pyarrow is not None and isinstance(column, pyarrow.Array):
+        return _transliterate_arrow(column, translator, memo)
+    if pandas is not None and isinstance(column, pandas.Series) and isinstance(column.dtype, pandas.CategoricalDtype):
+        return _transliterate_categorical(column, translator, memo)
+    if pandas is not None and isinstance(column, pandas.Series):
+        codes, values = pandas.factorize(column)
+        transliterations = numpy.array(_transliterate_values(values.tolist(), translator, memo) + [None], dtype=object)
+        # The code of missing values is -1, which takes the None at the end
+        dtype = column.dtype if pandas.api.types.is_string_dtype(column.dtype) else object
+        return pandas.Series(transliterations.take(codes), index=column.index, name=column.name, dtype=dtype)
+    return _transliterate_values(column, translator, memo)
@@ -0,0 +1,99 @@
+"""
+Exception dictionary: irregular words and proper names (Korean word or morpheme -> transliteration)
+that the rules get wrong. A Hangul instance given a dictionary transliterates the longest entry
+starting at every syllable of a word as given and the syllables between the entries with the rules.
+The entries form a trie whose nodes are kept in a dict keyed by their prefix, so a match costs
+one lookup per syllable of the entry, whatever the size of the dictionary.
+A dictionary file is either a JSON object or a text file with one word and its transliteration per line,
+separated by a tab (lines starting with # are comments).
+"""
+import unicodedata
+
+# Node of the trie which is not in it
+_MISSING = object()
+
+
+class Exceptions:
+    def __init__(self, entries=()):
+        """ entries is a dict or an iterable of (word, transliteration) pairs. """
+        # Prefix of an entry -> its transliteration if the prefix is an entry itself, None otherwise
+        self.nodes = {}
+        self.count = 0
+        for word, transliteration in (entries.items() if isinstance(entries, dict) else entries):
+            self.add(word, transliteration)
+
+    def __len__(self):
+        return self.count
+
+    def add(self, word, transliteration):
+        """ Add an entry, words are made of Korean syllables (jamos are composed), an entry can be replaced. """
+        word = unicodedata.normalize("NFC", word)
+        if not word or not all("\uac00" <= character <= "\ud7a3" for character in word):
+            raise ValueError("{} is not a Korean word".format(word))
+        if self.nodes.get(word) is None:
+            self.count += 1
+        for end in range(1, len(word)):
+            self.nodes.setdefault(word[:end], None)
+        self.nodes[word] = transliteration
+
+    def get(self, word):
+        """ Return the transliteration of an entry, None if the word is not one. """
+        return self.nodes.get(word)
+
+    @classmethod
+    def load(cls, path):
+        """ Read a dictionary from a JSON file or a tab-separated text file. """
+        # Imported here, json is not needed to import the package
+        import json
+        with open(path, mode="r", encoding="utf-8") as file:
+            if path.endswith(".json"):
+                return cls(json.load(file))
+            exceptions = cls()
+            for number, line in enumerate(file, 1):
+                line = line.rstrip("\r\n")
+                if not line.strip() or line.startswith("#"):
+                    continue
+                word, separator, transliteration = line.partition("\t")
+                if not separator:
+                    raise ValueError("{}:{}: a word and its transliteration must be separated by a tab".format(path, number))
+                exceptions.add(word.strip(), transliteration.strip())
+            return exceptions
+
+    def split(self, word):
+        """
+        Cut a word made of Korean syllables into the longest entries, searched from left to right, and the
+        text between them. Return a list of (text, transliteration) pairs, the transliteration being None for
+        the text between the entries, or None if there is no entry in the word.
+        """
+        nodes = self.nodes
+        pieces = []
+        # Start of the text before the current entry
+        start = 0
+        i = 0
+        length = len(word)
+        while i < length:
+            # Most syllables do not start an entry, the syllable on its own is looked up first
+            transliteration = nodes.get(word[i], _MISSING)
+            if transliteration is _MISSING:
+                i += 1
+                continue
+            end = i + 1 if transliteration is not None else 0
+            for j in range(i + 2, length + 1):
+                node = nodes.get(word[i:j], _MISSING)
+                if node is _MISSING:
+                    break
+                if node is not None:
+                    end = j
+                    transliteration = node
+            if end == 0:
+                i += 1
+                continue
+            if start != i:
+                pieces.append((word[start:i], None))
+            pieces.append((word[i:end], transliteration))
+            i = start = end
+        if not pieces:
+            return None
+        if start != len(word):
+            pieces.append((word[start:], None))
+        return pieces
@@ -0,0 +1,1081 @@
+import functools
+import re
+import sys
+import threading
+import time
+import unicodedata
+from array import array
+
+from .alignment import Alignment
+from .exceptions import Exceptions
+from .store import Store, write_store
+from .syllable import Syllable, Complex
+
+
+# Everything is purposefully redundant in this class
+# To help the developer understand the rules properly
+# Once the rules have been aggregated the program will be compressed
+# Instances can be shared between threads: the compiled tables are tuples shared by the class
+# and built once under compile_lock, the word cache is a functools.lru_cache, which is thread-safe
+class Hangul:
+    def __init__(self, transition_table=False, cache_size=0, store=None, profile=None, exceptions=None):
+        # Look up whole syllables in the transition table instead of their jamos one by one
+        self.transition_table = transition_table
+        # Number of Korean words whose transliteration is remembered, 0 disables and None unbounds the cache
+        self.cache_size = cache_size
+        # Store file (see save_store) with the rule tables and the transliteration of frequent words
+        self.store = Store(store) if isinstance(store, str) else store
+        if self.store is not None:
+            self.load_tables(self.store)
+        # Exception dictionary (see exceptions.Exceptions, or the path of one) consulted before the rules
+        self.exceptions = Exceptions.load(exceptions) if isinstance(exceptions, str) else exceptions
+        if cache_size != 0:
+            self.transliterate_korean = functools.lru_cache(cache_size)(self.transliterate_korean)
+        # Profile (see profiling.Profile) counting the rules and timing transliterate_text, None costs nothing
+        self.profile = profile
+        if profile is not None:
+            self.transliterate_text = self.transliterate_text_profiled
+
+    JLT = "ㄱ,ㄲ,ㄴ,ㄷ,ㄸ,ㄹ,ㅁ,ㅂ,ㅃ,ㅅ,ㅆ,ㅇ,ㅈ,ㅉ,ㅊ,ㅋ,ㅌ,ㅍ,ㅎ".split(",")
+    JTT = ",ㄱ,ㄲ,ㄱㅅ,ㄴ,ㄴㅈ,ㄴㅎ,ㄷ,ㄹ,ㄹㄱ,ㄹㅁ,ㄹㅂ,ㄹㅅ,ㄹㅌ,ㄹㅍ,ㄹㅎ,ㅁ,ㅂ,ㅂㅅ,ㅅ,ㅆ,ㅇ,ㅈ,ㅊ,ㅋ,ㅌ,ㅍ,ㅎ".split(",")
+    JVT = "ㅏ,ㅐ,ㅑ,ㅒ,ㅓ,ㅔ,ㅕ,ㅖ,ㅗ,ㅘ,ㅙ,ㅚ,ㅛ,ㅜ,ㅝ,ㅞ,ㅟ,ㅠ,ㅡ,ㅢ,ㅣ".split(",")
+    # Start of Hangul syllables in Unicode
+    SBase = 0xAC00
+    # Number of active Hangul syllables in Unicode
+    SCount = 11172
+    TCount = 28
+    # 11172 / 588 = 19 which is equal to the number of leading consonant jamos
+    NCount = 588
+    LCount = 19
+    VCount = 21
+    # Start of the conjoining jamos (decomposed syllables, e.g. NFD text) in Unicode, TBase stands for no batchim
+    LBase = 0x1100
+    VBase = 0x1161
+    TBase = 0x11A7
+
+    # Trailing consonants with the complex ones merged into a single jamo (e.g. ㄱㅅ -> ㄳ)
+    JTT_MERGED = [Complex.merge_characters(t) if len(t) == 2 else t for t in JTT]
+    # Jamo -> index lookups for converting Syllable objects, no batchim has the index 0
+    LIndices = {jamo: i for i, jamo in enumerate(JLT)}
+    VIndices = {jamo: i for i, jamo in enumerate(JVT)}
+    TIndices = {jamo: i for i, jamo in enumerate(JTT_MERGED) if i != 0}
+    TIndices[None] = 0
+    # Modern conjoining jamos and compatibility jamos (the consonants and vowels on their own, e.g. ㄱ and ㅏ)
+    JAMO = frozenset(map(chr, [*range(LBase, LBase + LCount), *range(VBase, VBase + VCount),
+                               *range(TBase + 1, TBase + TCount), *range(0x3131, 0x3164)]))
+
+    # Compiled rule tables, built on first use by compile_tables
+    # Jamo indices of every syllable, see syllables_to_characters
+    syllable_indices = None
+    word_initial_table = None
+    syllable_initial_table = None
+    vowel_table = None
+    word_final_table = None
+    syllable_final_table = None
+    # Scheme (see schemes.Scheme) changing the output of the rules, None for the rules as they are
+    scheme = None
+    # Held while tables are compiled or loaded, so that concurrent first uses build them only once.
+    # Reentrant, the transition table and the scheme engines compile the rule tables with it held
+    compile_lock = threading.RLock()
+
+    @classmethod
+    def compile_tables(cls):
+        """
+        Evaluate the rules of this class for every jamo and every context they depend on
+        and store the results in flat lists, so that a syllable costs a few list lookups
+        instead of going through the if/elif chains.
+        Context tables are indexed as (batchim * LCount + leading consonant) * VCount + vowel.
+        For syllable-initial consonants the batchim is the one of the previous syllable,
+        for syllable-final consonants the leading consonant and the vowel are the ones of the next syllable.
+        The batchim index 0 means that there is no batchim.
+        """
+        if cls.vowel_table is not None:
+            return
+        with cls.compile_lock:
+            if cls.vowel_table is None:
+                cls.compile_rule_tables()
+
+    @classmethod
+    def compile_rule_tables(cls):
+        """ Build the tables of compile_tables, the caller holds compile_lock. """
+        if cls.scheme is not None:
+            # Schemes share the rules, their tables are made from the ones of Hangul
+            Hangul.compile_tables()
+            cls.scheme.compile_tables(cls)
+            return
+        cls.compile_syllable_indices()
+        word_initial = [cls.word_initial_consonants_with_vowel(l, v) for l in cls.JLT for v in cls.JVT]
+        vowel = [cls.transliterate_vowel(v) for v in cls.JVT]
+        word_final = [""] + [cls.word_final_consonants(t) for t in cls.JTT_MERGED[1:]]
+        syllable_initial = []
+        syllable_final = []
+        for i, t in enumerate(cls.JTT_MERGED):
+            batchim = t if i != 0 else None
+            for l in cls.JLT:
+                for v in cls.JVT:
+                    syllable_initial.append(cls.syllable_initial_consonants(batchim, l, v))
+                    if batchim is None:
+                        syllable_final.append("")
+                    else:
+                        syllable_final.append(cls.syllable_final_consonants(batchim, Syllable(l, v, None)))
+        cls.word_initial_table = tuple(word_initial)
+        cls.syllable_initial_table = tuple(syllable_initial)
+        cls.word_final_table = tuple(word_final)
+        cls.syllable_final_table = tuple(syllable_final)
+        # Set last, it marks the tables as compiled
+        cls.vowel_table = tuple(vowel)
+
+    @classmethod
+    def compile_syllable_indices(cls):
+        """ Decompose every syllable into its jamo indices once, so that words can be unpacked with lookups. """
+        cls.syllable_indices = tuple((SIndex // cls.NCount, (SIndex % cls.NCount) // cls.TCount, SIndex % cls.TCount)
+                                     for SIndex in range(cls.SCount))
+
+    # Tables and their lengths in the order they are saved in store files
+    STORED_TABLES = [("word_initial_table", LCount * VCount),
+                     ("syllable_initial_table", TCount * LCount * VCount),
+                     ("word_final_table", TCount),
+                     ("syllable_final_table", TCount * LCount * VCount),
+                     ("vowel_table", VCount)]
+
+    @classmethod
+    def scheme_identity(cls):
+        """ Name and digest of the scheme of this class (see schemes.Scheme.digest), written into store files. """
+        if cls.scheme is None:
+            return "hungarian", bytes(16)
+        return cls.scheme.name, cls.scheme.digest()
+
+    @classmethod
+    def load_tables(cls, store: Store):
+        """ Take the rule tables from a store file instead of compiling them. """
+        if store.scheme != cls.scheme_identity():
+            raise ValueError("The store was saved with the {} scheme, not with {}".format(
+                store.scheme[0], cls.scheme_identity()[0]))
+        if cls.vowel_table is not None:
+            return
+        strings = store.tables()
+        if len(strings) != sum(length for _, length in cls.STORED_TABLES):
+            raise ValueError("The tables of the store do not match this version of the program")
+        with cls.compile_lock:
+            if cls.vowel_table is not None:
+                return
+            cls.compile_syllable_indices()
+            start = 0
+            # The vowel table is set last, it marks the tables as compiled
+            for name, length in cls.STORED_TABLES:
+                setattr(cls, name, tuple(strings[start:start + length]))
+                start += length
+
+    def save_store(self, path, words=()):
+        """
+        Save the rule tables and the transliteration of the given Korean words into a store file,
+        which can be passed to Hangul to skip compiling the tables and transliterating these words.
+        """
+        self.compile_tables()
+        transliterations = {}
+        for word in words:
+            if not word or not all(self.is_character_korean(character) for character in word):
+                raise ValueError("{} is not a Korean word".format(word))
+            transliterations[word] = self.transliterate_korean(word)
+        write_store(path, [string for name, _ in self.STORED_TABLES for string in getattr(self, name)], transliterations,
+                    self.scheme_identity())
+
+    # Transition table, built on first use by compile_transition_table
+    transition_fragments = None
+    transition_offsets = None
+    transition_strides = None
+    transition_previous_classes = None
+    transition_next_classes = None
+    transition_build_time = None
+
+    @classmethod
+    def compile_transition_table(cls):
+        """
+        Store the whole transliteration of every syllable in every context it can appear in.
+        The previous batchims are grouped into classes which give the same leading consonant for the
+        current syllable, and the next syllables are grouped into classes which give the same batchim
+        for the current syllable. Class 0 stands for the start and the end of the word respectively.
+        The fragments of a syllable (s) are stored from transition_offsets[s] with
+        transition_strides[batchim] next classes per previous class.
+        """
+        if cls.transition_fragments is not None:
+            return
+        with cls.compile_lock:
+            if cls.transition_fragments is None:
+                cls.build_transition_table()
+
+    @classmethod
+    def build_transition_table(cls):
+        """ Build the table of compile_transition_table, the caller holds compile_lock. """
+        cls.compile_tables()
+        start = time.perf_counter()
+        LCount, VCount, TCount = cls.LCount, cls.VCount, cls.TCount
+
+        # previous_classes[previous batchim * LCount + leading consonant] -> class of the previous batchim
+        previous_classes = [0] * (TCount * LCount)
+        # Representative previous batchim of every class, per leading consonant
+        previous_representatives = []
+        for l in range(LCount):
+            rows = {}
+            representatives = [None]
+            for t in range(TCount):
+                row = tuple(cls.syllable_initial_table[(t * LCount + l) * VCount + v] for v in range(VCount))
+                if row not in rows:
+                    rows[row] = len(representatives)
+                    representatives.append(t)
+                previous_classes[t * LCount + l] = rows[row]
+            previous_representatives.append(representatives)
+
+        # next_classes[(batchim * LCount + next leading consonant) * VCount + next vowel] -> class of the next syllable
+        next_classes = [0] * (TCount * LCount * VCount)
+        # Transliteration of the batchim for every class, per batchim
+        next_batchims = []
+        for t in range(TCount):
+            batchims = {}
+            strings = [cls.word_final_table[t]]
+            for lv in range(LCount * VCount):
+                batchim = cls.syllable_final_table[t * LCount * VCount + lv]
+                if batchim not in batchims:
+                    batchims[batchim] = len(strings)
+                    strings.append(batchim)
+                next_classes[t * LCount * VCount + lv] = batchims[batchim]
+            next_batchims.append(strings)
+
+        fragments = []
+        # Identical fragments share the same string
+        unique = {}
+        offsets = []
+        strides = [len(strings) for strings in next_batchims]
+        for l in range(LCount):
+            for v in range(VCount):
+                vowel = cls.vowel_table[v]
+                for t in range(TCount):
+                    offsets.append(len(fragments))
+                    for c, representative in enumerate(previous_representatives[l]):
+                        if representative is None:
+                            initial = cls.word_initial_table[l * VCount + v]
+                        else:
+                            initial = cls.syllable_initial_table[(representative * LCount + l) * VCount + v]
+                        for batchim in next_batchims[t]:
+                            fragment = initial + vowel + batchim
+                            fragments.append(unique.setdefault(fragment, fragment))
+
+        cls.transition_offsets = tuple(offsets)
+        cls.transition_strides = tuple(strides)
+        cls.transition_previous_classes = tuple(previous_classes)
+        cls.transition_next_classes = tuple(next_classes)
+        cls.transition_build_time = time.perf_counter() - start
+        # Set last, it marks the table as compiled
+        cls.transition_fragments = tuple(fragments)
+
+    @classmethod
+    def transition_table_stats(cls):
+        """ Report the size and the build time of the transition table, building it if needed. """
+        cls.compile_transition_table()
+        fragments = cls.transition_fragments
+        unique = {id(fragment): fragment for fragment in fragments}
+        lists = [fragments, cls.transition_offsets, cls.transition_strides,
+                 cls.transition_previous_classes, cls.transition_next_classes]
+        return {
+            "entries": len(fragments),
+            "unique_fragments": len(unique),
+            "previous_classes": max(cls.transition_previous_classes) + 1,
+            "next_classes": max(cls.transition_next_classes) + 1,
+            "size_bytes": sum(sys.getsizeof(x) for x in lists) + sum(sys.getsizeof(x) for x in unique.values()),
+            "build_time": cls.transition_build_time,
+        }
+
+    def syllables_to_characters(self, text):
+        """
+        Hangul syllables consists of 2 to 3 characters (because of diphthongs sometimes 4).
+        There are all together 11.732 Hangul syllables registered in unicode but all of
+        these characters can be broken down to 2 or 3 characters.
+        Original version of this function:
+        https://stackoverflow.com/a/12765973/7257264
+        The three parts of the syllables is as follows:
+        - Leading consonant jamo
+        - Vowel jamo
+        - Trailing consonant jamo
+        The calculations inside the function can be explained by taking a look at the Hangul syllables in Unicode:
+        https://en.wikipedia.org/wiki/Hangul_Syllables
+        The table is very logical, it goes through all the leading consonant jamos,
+        the vowel jamos and the trailing consonant jamos in alphabetical order.
+        The program may also be rewritten in a way to create a map to all possible hangul syllables
+        and use that.
+        """
+        letters = []
+        for s in text:
+            code_point = ord(s)
+            SIndex = code_point - self.SBase
+            # If the syllable is in the Hangul range of Unicode
+            if 0 <= SIndex < self.SCount:
+                LIndex = SIndex // self.NCount
+                VIndex = (SIndex % self.NCount) // self.TCount
+                TIndex = SIndex % self.TCount
+                letters.append(self.JLT[LIndex])
+                letters.append(self.JVT[VIndex])
+                letters.append(self.JTT[TIndex])
+            # Conjoining jamos are written as the jamos of syllables
+            elif 0 <= code_point - self.LBase < self.LCount:
+                letters.append(self.JLT[code_point - self.LBase])
+            elif 0 <= code_point - self.VBase < self.VCount:
+                letters.append(self.JVT[code_point - self.VBase])
+            elif 0 < code_point - self.TBase < self.TCount:
+                letters.append(self.JTT[code_point - self.TBase])
+            else:
+                letters.append(s)
+        return "".join(letters)
+
+    @staticmethod
+    def default_consonant(consonant):
+        """ Retrieve the default pronunciation a Korean consonant. """
+        # Simple consonants
+        if consonant == "ㄱ":
+            return "g"
+        elif consonant == "ㄴ":
+            return "n"
+        elif consonant == "ㄷ":
+            return "d"
+        elif consonant == "ㄹ":
+            return "r"
+        elif consonant == "ㅁ":
+            return "m"
+        elif consonant == "ㅂ":
+            return "b"
+        elif consonant == "ㅅ":
+            return "sz"
+        elif consonant == "ㅇ":
+            return "ng"
+        elif consonant == "ㅈ":
+            return "dzs"
+        elif consonant == "ㅊ":
+            return "cs"
+        elif consonant == "ㅋ":
+            return "k"
+        elif consonant == "ㅌ":
+            return "t"
+        elif consonant == "ㅍ":
+            return "p"
+        elif consonant == "ㅎ":
+            return "h"
+        # Tense consonants
+        elif consonant == "ㄲ":
+            return "gg"
+        elif consonant == "ㄸ":
+            return "dd"
+        elif consonant == "ㅃ":
+            return "bb"
+        elif consonant == "ㅆ":
+            return "ssz"
+        elif consonant == "ㅉ":
+            return "ddzs"
+        # Complex consonants
+        elif consonant == "ㄳ":
+            return "gsz"
+        elif consonant == "ㄵ":
+            return "ndzs"
+        elif consonant == "ㄶ":
+            return "nh"
+        elif consonant == "ㄺ":
+            return "rg"
+        elif consonant == "ㄻ":
+            return "rm"
+        elif consonant == "ㄼ":
+            return "rb"
+        elif consonant == "ㄽ":
+            return "rs"
+        elif consonant == "ㄾ":
+            return "rt"
+        elif consonant == "ㄿ":
+            return "rp"
+        elif consonant == "ㅀ":
+            return "rh"
+        elif consonant == "ㅄ":
+            return "bsz"
+        else:
+            raise ValueError
+
+    # Part 4 Section 8 Korean Prules rule is unclear
+    # The rules regarding the pronunciation of 'ㅅ' are not properly described
+    # The rules about the pronunciation of 'ㄹ' are lacking
+    @staticmethod
+    def syllable_final_consonants(current_batchim, next_syllable: Syllable):
+        """ Transliterate a Korean consonant at the end of a syllable. """
+        # Simple consonants
+        # &
+        # Tense consonants (these all could be potentially wrong, the same rules
+        # may apply to them as to the simples, it needs to be tested)
+        # Maybe the consonants should be doubled for tense consonants.
+
+        # Sound assimilation to ㄴ and ㅁ
+        if next_syllable.leading_consonant in ["ㄴ", "ㅁ"]:
+            if current_batchim in ["ㄱ", "ㄲ", "ㅋ", "ㄳ", "ㄺ"]:
+                return "ng"
+            elif current_batchim in ["ㅍ", "ㄼ", "ㄿ", "ㅄ"]:
+                return "m"
+            elif current_batchim in ["ㅂ", "ㅃ"]:
+                return "m" if current_batchim == "ㅂ" else "mm"
+            elif current_batchim in ["ㅅ", "ㅆ"]:
+                return "n" if current_batchim == "ㅅ" else "nn"
+            elif current_batchim == ["ㄷ", "ㄸ", "ㅈ", "ㅉ"]:
+                return "n" if current_batchim in ["ㄷ", "ㅈ"] else "nn"
+            elif current_batchim in ["ㅊ", "ㅌ", "ㅎ", "ㄵ"]:
+                return "n"
+
+        # No sound before ㅎ
+        if next_syllable.leading_consonant == "ㅎ":
+            if current_batchim in ["ㄱ", "ㄲ", "ㄷ", "ㄸ", "ㅂ", "ㅃ", "ㅅ", "ㅆ", "ㅈ", "ㅉ", "ㅊ", "ㅌ", "ㄵ"]:
+                return ""
+
+        # Sound assimilation before syllable that begins with ㅣ
+        if current_batchim in ["ㄷ", "ㅌ", "ㄾ"]:
+            if next_syllable.leading_consonant == "ㅇ" and next_syllable.vowel == "ㅣ":
+                return ""
+
+        if current_batchim == "ㄹ" and next_syllable.leading_consonant != "ㅇ":
+            return "l"
+        elif current_batchim in ["ㅅ", "ㅆ"]:
+            if next_syllable.leading_consonant in ["ㅈ", "ㅊ", "ㅌ"]:
+                return ""
+            elif next_syllable.leading_consonant == "ㅇ":
+                if next_syllable.vowel in ["ㅣ", "ㅟ", "ㅢ"]:
+                    return "s" if current_batchim == "ㅅ" else "ss"
+                else:
+                    return "sz" if current_batchim == "ㅅ" else "ssz"
+            elif next_syllable.leading_consonant == "ㄷ":
+                return "d"
+            elif next_syllable.leading_consonant == "ㄱ":
+                return "t"
+        elif current_batchim in ["ㅈ", "ㅉ"]:
+            return "d"
+        elif current_batchim == "ㅊ":
+            return "n"
+        elif current_batchim == "ㅋ":
+            return "g"
+        elif current_batchim == "ㅍ":
+            return "b"
+        elif current_batchim == "ㅎ":
+            if next_syllable.leading_consonant in ["ㄱ", "ㄲ", "ㄷ", "ㅈ", "ㅊ", "ㅅ"]:
+                return ""
+        # Complex consonants
+        elif current_batchim == "ㄳ":
+            if next_syllable.leading_consonant in ["ㄱ", "ㄲ"]:
+                return "g"
+        elif current_batchim == "ㄵ":
+            if next_syllable.leading_consonant == "ㄷ":
+                return "d"
+        elif current_batchim == "ㄶ":
+            if next_syllable.leading_consonant in ["ㄱ", "ㄲ", "ㄷ", "ㅈ", "ㄴ", "ㅇ"]:
+                return "n"
+            elif next_syllable.leading_consonant == "ㅅ":
+                return "n"
+        elif current_batchim == "ㄺ":
+            if next_syllable.leading_consonant == "ㄱ":
+                return "r"
+            else:
+                return "n"
+        elif current_batchim == "ㄻ":
+            return "m"
+        elif current_batchim in ["ㄼ", "ㄽ", "ㄾ"]:
+            return "r" if next_syllable.leading_consonant == "ㅇ" else "l"
+        elif current_batchim == "ㄿ":
+            return "b"
+        elif current_batchim == "ㅀ":
+            if next_syllable.leading_consonant in ["ㄱ", "ㄷ", "ㅈ", "ㅅ", "ㅆ", "ㄴ"]:
+                return "r"
+        elif current_batchim == "ㅄ":
+            if next_syllable.leading_consonant == "ㅇ":
+                return "bs"
+
+        # Other cases such as:
+        # ㄴ, ㅁ, ㅇ
+        return Hangul.default_consonant(current_batchim)
+
+    @staticmethod
+    def syllable_initial_consonants(previous_batchim, current_initial, current_vowel):
+        """ Transliterate a Korean consonant at the beginning of a syllable. """
+        # Simple consonants and tense consonants
+        if current_initial in ["ㄱ", "ㄲ"]:
+            if previous_batchim == "ㄺ":
+                return "l" if current_initial == "ㄱ" else "ll"
+            elif previous_batchim == "ㅎ":
+                return "k" if current_initial == "ㄱ" else "kk"
+        elif current_initial == "ㄴ":
+            if previous_batchim in ["ㅀ", "ㄹ"]:
+                return "l"
+        elif current_initial in ["ㄷ", "ㄸ"]:
+            if previous_batchim in ["ㅎ", "ㄶ", "ㅀ"]:
+                return "t" if current_initial == "ㄷ" else "tt"
+        elif current_initial == "ㄹ":
+            if previous_batchim in ["ㅁ", "ㅇ", "ㄱ", "ㅂ"]:
+                return "n"
+            elif previous_batchim is not None:
+                return "l"
+        elif current_initial in ["ㅅ", "ㅆ"]:
+            if previous_batchim in ["ㅎ", "ㄶ", "ㅀ"]:
+                return "ssz"
+            if current_vowel in ["ㅣ", "ㅟ", "ㅢ"]:
+                return "ss" if current_initial == "ㅆ" else "s"
+        elif current_initial == "ㅇ":
+            if current_vowel == "ㅣ":
+                if previous_batchim in ["ㅌ", "ㄾ"]:
+                    return "cs"
+                elif previous_batchim == "ㄷ":
+                    return "dzs"
+            # If the previous character was complex (but not ㄾ) we take the default pronunciation of the second
+            # letter from that.
+            if Complex.is_complex(previous_batchim):
+                return Hangul.default_consonant(Complex.separate_characters(previous_batchim).second)
+            else:
+                return ""
+        elif current_initial in ["ㅈ", "ㅉ"]:
+            if previous_batchim in ["ㅎ", "ㄶ", "ㅀ"]:
+                return "cs" if current_initial == "ㅈ" else "css"
+        elif current_initial == "ㅎ":
+            if previous_batchim in ["ㄱ", "ㄺ"]:
+                return "k"
+            elif previous_batchim in ["ㄷ", "ㅌ", "ㅅ"]:
+                return "t"
+            elif previous_batchim in ["ㅂ", "ㄼ"]:
+                return "p"
+            elif previous_batchim in ["ㅈ", "ㄵ"]:
+                return "dzs"
+            elif previous_batchim == "ㅊ":
+                return "cs"
+
+        # Other cases such as:
+        # ㅁ, ㅂ, ㅊ, ㅋ, ㅌ, ㅍ
+        # ㅃ
+        return Hangul.default_consonant(current_initial)
+
+    @staticmethod
+    def word_final_consonants(consonant):
+        """ Transliterate a Korean consonant at the end of a word. """
+        if consonant == "ㄱ":
+            return "k"
+        elif consonant == "ㄴ":
+            return "n"
+        elif consonant == "ㄷ":
+            return "t"
+        elif consonant == "ㄹ":
+            return "l"
+        elif consonant == "ㅁ":
+            return "m"
+        elif consonant == "ㅂ":
+            return "p"
+        elif consonant == "ㅅ":
+            return "d"
+        elif consonant == "ㅇ":
+            return "ng"
+        elif consonant == "ㅈ":
+            return "d"
+        elif consonant == "ㅊ":
+            return "d"
+        elif consonant == "ㅋ":
+            return "g"
+        elif consonant == "ㅌ":
+            return "d"
+        elif consonant == "ㅍ":
+            return "b"
+        elif consonant == "ㅎ":
+            return ""
+        # Tense consonants
+        elif consonant == "ㄲ":
+            return "kk"
+        elif consonant == "ㄸ":
+            return ""
+        elif consonant == "ㅃ":
+            return ""
+        elif consonant == "ㅆ":
+            return "d"
+        elif consonant == "ㅉ":
+            return ""
+        # Complex consonants
+        elif consonant == "ㄳ":
+            return "k"
+        elif consonant == "ㄵ":
+            return "n"
+        elif consonant == "ㄶ":
+            return "n"
+        elif consonant == "ㄺ":
+            return "k"
+        elif consonant == "ㄻ":
+            return "m"
+        elif consonant == "ㄼ":
+            return "r"
+        elif consonant == "ㄽ":
+            return "r"
+        elif consonant == "ㄾ":
+            return "r"
+        elif consonant == "ㄿ":
+            return "p"
+        elif consonant == "ㅀ":
+            return "r"
+        elif consonant == "ㅄ":
+            return "p"
+        raise ValueError
+
+    @staticmethod
+    def word_initial_consonants_with_vowel(consonant, vowel):
+        """ For special cases where the vowel affects the pronunciation (e.g. ㅅ) """
+        if consonant == "ㅅ":
+            if vowel in ["ㅣ", "ㅟ", "ㅢ"]:
+                return "s"
+        return Hangul.word_initial_consonants(consonant)
+
+    @staticmethod
+    def word_initial_consonants(consonant):
+        """ Transliterate a Korean consonant at the beginning of a word. """
+        if consonant == "ㄱ":
+            return "k"
+        elif consonant == "ㄴ":
+            return "n"
+        elif consonant == "ㄷ":
+            return "t"
+        elif consonant == "ㄹ":
+            return "l"
+        elif consonant == "ㅁ":
+            return "m"
+        elif consonant == "ㅂ":
+            return "p"
+        elif consonant == "ㅅ":
+            return "sz"
+        elif consonant == "ㅇ":
+            return ""
+        elif consonant == "ㅈ":
+            return "dzs"
+        elif consonant == "ㅊ":
+            return "cs"
+        elif consonant == "ㅋ":
+            return "k"
+        elif consonant == "ㅌ":
+            return "t"
+        elif consonant == "ㅍ":
+            return "p"
+        elif consonant == "ㅎ":
+            return "h"
+        # Tense consonants
+        elif consonant == "ㄲ":
+            return "kk"
+        elif consonant == "ㄸ":
+            return "tt"
+        elif consonant == "ㅃ":
+            return "pp"
+        elif consonant == "ㅆ":
+            return "ss"
+        elif consonant == "ㅉ":
+            return "ddzs"
+        raise ValueError
+
+    @staticmethod
+    def transliterate_vowel(vowel):
+        """ Transliterate a Korean vowel. Default pronunciation is used. """
+        # Normal vowels
+        if vowel == "ㅏ":
+            return "á"
+        elif vowel == "ㅑ":
+            return "já"
+        elif vowel == "ㅓ":
+            return "a"
+        elif vowel == "ㅕ":
+            return "ja"
+        elif vowel == "ㅗ":
+            return "o"
+        elif vowel == "ㅛ":
+            return "jo"
+        elif vowel == "ㅜ":
+            return "u"
+        elif vowel == "ㅠ":
+            return "ju"
+        elif vowel == "ㅡ":
+            return "ü"
+        elif vowel == "ㅣ":
+            return "i"
+        # Complex vowels
+        elif vowel == "ㅐ":
+            return "é"  # Alternatively e
+        elif vowel == "ㅒ":
+            return "jé"  # Alternatively je
+        elif vowel == "ㅔ":
+            return "é"
+        elif vowel == "ㅖ":
+            return "jé"
+        # Complex vowels with more than one characters (the syllables_to_characters method doesn't break them)
+        elif vowel == "ㅘ":
+            return "vá"
+        elif vowel == "ㅙ":
+            return "vé"
+        elif vowel == "ㅚ":
+            return "vé"
+        elif vowel == "ㅝ":
+            return "va"
+        elif vowel == "ㅞ":
+            return "vé"
+        elif vowel == "ㅟ":
+            return "vi"
+        elif vowel == "ㅢ":
+            return "üi"
+        raise ValueError
+
+    @staticmethod
+    def syllable_to_indices(syllable: Syllable):
+        """ Convert a Syllable to its (leading consonant, vowel, batchim) jamo indices. """
+        return (Hangul.LIndices[syllable.leading_consonant], Hangul.VIndices[syllable.vowel],
+                Hangul.TIndices[syllable.batchim])
+
+    @staticmethod
+    def unpack_syllables(word):
+        """ Return the (leading consonant, vowel, batchim) jamo indices of a word made of Korean syllables as a list. """
+        Hangul.compile_tables()
+        syllable_indices = Hangul.syllable_indices
+        SBase = Hangul.SBase
+        indices = []
+        for character in word:
+            indices.extend(syllable_indices[ord(character) - SBase])
+        return indices
+
+    @staticmethod
+    def compose_syllables(word):
+        """
+        Compose the syllables of a run of Korean syllables and jamos (see KOREAN_WORD) on the fly.
+        A syllable is either precomposed (optionally followed by a conjoining batchim if it has none),
+        conjoining jamos or compatibility jamos, the latter taking a consonant before a consonant or
+        at the end as the batchim. Jamos which are not part of a syllable split the run into words.
+        Return a list of (text, indices, lengths), indices being the jamo indices of the syllables of text
+        (see unpack_syllables) and lengths their number of characters, or None for a jamo on its own.
+        """
+        Hangul.compile_tables()
+        syllable_indices = Hangul.syllable_indices
+        SBase, SCount, TCount = Hangul.SBase, Hangul.SCount, Hangul.TCount
+        LBase, VBase, TBase = Hangul.LBase, Hangul.VBase, Hangul.TBase
+        LCount, VCount = Hangul.LCount, Hangul.VCount
+        LIndices, VIndices, TIndices = Hangul.LIndices, Hangul.VIndices, Hangul.TIndices
+        # Sentinel so that the characters after the current one can always be looked at
+        codes = [ord(character) for character in word] + [0, 0, 0]
+        pieces = []
+        indices = []
+        lengths = []
+        start = 0
+        i = 0
+        while i < len(word):
+            code_point = codes[i]
+            length = 0
+            if 0 <= code_point - SBase < SCount:
+                l, v, t = syllable_indices[code_point - SBase]
+                length = 1
+                if t == 0 and 0 < codes[i + 1] - TBase < TCount:
+                    t = codes[i + 1] - TBase
+                    length = 2
+            elif 0 <= code_point - LBase < LCount and 0 <= codes[i + 1] - VBase < VCount:
+                l = code_point - LBase
+                v = codes[i + 1] - VBase
+                t = 0
+                length = 2
+                if 0 < codes[i + 2] - TBase < TCount:
+                    t = codes[i + 2] - TBase
+                    length = 3
+            elif word[i] in LIndices and word[i + 1:i + 2] in VIndices:
+                l = LIndices[word[i]]
+                v = VIndices[word[i + 1]]
+                t = 0
+                length = 2
+                if word[i + 2:i + 3] in TIndices and word[i + 3:i + 4] not in VIndices:
+                    t = TIndices[word[i + 2]]
+                    length = 3
+            if length == 0:
+                if indices:
+                    pieces.append((word[start:i], indices, lengths))
+                    indices = []
+                    lengths = []
+                pieces.append((word[i], None, None))
+                i += 1
+                start = i
+            else:
+                indices.extend((l, v, t))
+                lengths.append(length)
+                i += length
+        if indices:
+            pieces.append((word[start:], indices, lengths))
+        return pieces
+
+    @staticmethod
+    def pack_word(word):
+        """
+        Pack a word made of Korean syllables into an array holding the leading consonant, vowel and
+        batchim jamo indices of the syllables one after the other.
+        """
+        return array("H", Hangul.unpack_syllables(word))
+
+    @classmethod
+    def transliterate_word(cls, word):
+        """ Transliterate a Korean word, given as a list of Syllable objects or packed (see pack_word). """
+        if not isinstance(word, array):
+            packed = array("H")
+            for syllable in word:
+                packed.extend(Hangul.syllable_to_indices(syllable))
+            word = packed
+        return cls.transliterate_indices(word)
+
+    @classmethod
+    def transliterate_indices(cls, word):
+        """ Transliterate a Korean word given as consecutive (leading consonant, vowel, batchim) jamo indices. """
+        cls.compile_tables()
+        word_initial = cls.word_initial_table
+        syllable_initial = cls.syllable_initial_table
+        vowel = cls.vowel_table
+        word_final = cls.word_final_table
+        syllable_final = cls.syllable_final_table
+        VCount = cls.VCount
+        LVCount = cls.LCount * VCount
+        parts = []
+
+        # The batchim of a syllable is written when the next syllable is reached,
+        # the two context tables share the same index
+        previous_t = None
+        for l, v, t in zip(word[0::3], word[1::3], word[2::3]):
+            lv = l * VCount + v
+            if previous_t is None:
+                parts.append(word_initial[lv])
+            else:
+                context = previous_t * LVCount + lv
+                parts.append(syllable_final[context])
+                parts.append(syllable_initial[context])
+            parts.append(vowel[v])
+            previous_t = t
+        if previous_t is not None:
+            parts.append(word_final[previous_t])
+
+        return "".join(parts)
+
+    @classmethod
+    def syllable_fragments(cls, word):
+        """ Same as transliterate_indices, but returns the transliteration of every syllable separately. """
+        cls.compile_tables()
+        word_initial = cls.word_initial_table
+        syllable_initial = cls.syllable_initial_table
+        vowel = cls.vowel_table
+        word_final = cls.word_final_table
+        syllable_final = cls.syllable_final_table
+        VCount = cls.VCount
+        LVCount = cls.LCount * VCount
+        fragments = []
+
+        previous_t = None
+        for l, v, t in zip(word[0::3], word[1::3], word[2::3]):
+            lv = l * VCount + v
+            if previous_t is None:
+                fragment = word_initial[lv] + vowel[v]
+            else:
+                context = previous_t * LVCount + lv
+                fragments[-1] += syllable_final[context]
+                fragment = syllable_initial[context] + vowel[v]
+            fragments.append(fragment)
+            previous_t = t
+        if previous_t is not None:
+            fragments[-1] += word_final[previous_t]
+
+        return fragments
+
+    @classmethod
+    def transliterate_transitions(cls, word):
+        """ Same as transliterate_indices, but looks up whole syllables in the transition table. """
+        cls.compile_transition_table()
+        fragments = cls.transition_fragments
+        offsets = cls.transition_offsets
+        strides = cls.transition_strides
+        previous_classes = cls.transition_previous_classes
+        next_classes = cls.transition_next_classes
+        LCount = cls.LCount
+        VCount = cls.VCount
+        TCount = cls.TCount
+
+        last = len(word) - 3
+        parts = []
+        for i in range(0, last + 3, 3):
+            l = word[i]
+            v = word[i + 1]
+            t = word[i + 2]
+            previous_class = previous_classes[word[i - 1] * LCount + l] if i != 0 else 0
+            if i == last:
+                next_class = 0
+            else:
+                next_class = next_classes[(t * LCount + word[i + 3]) * VCount + word[i + 4]]
+            parts.append(fragments[offsets[(l * VCount + v) * TCount + t] + previous_class * strides[t] + next_class])
+        return "".join(parts)
+
+    def is_character_korean(self, character):
+        """
+        Only returns true for Korean syllables and the jamos they can be composed of (see JAMO).
+        See: https://en.wikipedia.org/wiki/Hangul_Syllables
+        """
+        code_point = ord(character)
+        SIndex = code_point - self.SBase
+        if 0 <= SIndex < self.SCount:
+            return True
+        else:
+            return character in self.JAMO
+
+    def transliterate_korean(self, word):
+        """ Transliterate a word made of Korean syllables and jamos only, jamos which are not part of a syllable are kept. """
+        if self.exceptions is not None:
+            # The exceptions come first, a store may have been saved without them
+            pieces = self.match_exceptions(word)
+            if pieces is not None:
+                return "".join(text if indices is None else self.transliterate_syllables(indices)
+                               for text, indices, _ in pieces)
+        if self.store is not None:
+            transliteration = self.store.get(word)
+            if transliteration is not None:
+                return transliteration
+        # Jamos come before the syllables in Unicode
+        if min(word) < "\uac00":
+            # NFC composes the conjoining jamos in C, compose_syllables takes care of the rest (e.g. compatibility jamos)
+            word = unicodedata.normalize("NFC", word)
+        if min(word) < "\uac00":
+            return "".join(text if indices is None else self.transliterate_syllables(indices)
+                           for text, indices, _ in self.compose_syllables(word))
+        return self.transliterate_syllables(self.unpack_syllables(word))
+
+    def match_exceptions(self, word):
+        """
+        Cut a word made of Korean syllables and jamos into pieces (see compose_syllables) at the entries of the
+        exception dictionary, which are matched over the composed syllables. An entry becomes a
+        (transliteration, None, [number of characters]) piece. Return None if there is no entry in the word.
+        """
+        if min(word) >= "\uac00":
+            entries = self.exceptions.split(word)
+            if entries is None:
+                return None
+            return [(piece, self.unpack_syllables(piece), None) if transliteration is None
+                    else (transliteration, None, [len(piece)])
+                    for piece, transliteration in entries]
+        SBase, VCount, TCount = self.SBase, self.VCount, self.TCount
+        pieces = []
+        matched = False
+        for text, indices, lengths in self.compose_syllables(word):
+            entries = None
+            if indices is not None:
+                syllables = "".join(chr(SBase + (indices[i] * VCount + indices[i + 1]) * TCount + indices[i + 2])
+                                    for i in range(0, len(indices), 3))
+                entries = self.exceptions.split(syllables)
+            if entries is None:
+                pieces.append((text, indices, lengths))
+                continue
+            matched = True
+            # Position of the current entry in the syllables and in the text
+            syllable = 0
+            offset = 0
+            for piece, transliteration in entries:
+                count = len(piece)
+                length = sum(lengths[syllable:syllable + count])
+                if transliteration is None:
+                    pieces.append((text[offset:offset + length], indices[3 * syllable:3 * (syllable + count)],
+                                   lengths[syllable:syllable + count]))
+                else:
+                    pieces.append((transliteration, None, [length]))
+                syllable += count
+                offset += length
+        return pieces if matched else None
+
+    def transliterate_syllables(self, indices):
+        """ Transliterate the jamo indices of a word with the rule tables or the transition table. """
+        if self.transition_table:
+            return self.transliterate_transitions(indices)
+        return self.transliterate_indices(indices)
+
+    def cache_info(self):
+        """ Hits, misses and size of the word cache (see functools.lru_cache), None if the cache is disabled. """
+        if self.cache_size == 0:
+            return None
+        return self.transliterate_korean.cache_info()
+
+    def cache_clear(self):
+        """ Empty the word cache. """
+        if self.cache_size != 0:
+            self.transliterate_korean.cache_clear()
+
+    # Maximal runs of Korean syllables and jamos
+    KOREAN_WORD = re.compile("[\uac00-\ud7a3\u1100-\u1112\u1161-\u1175\u11a8-\u11c2\u3131-\u3163]+")
+
+    def transliterate_text(self, text, alignment=False):
+        """
+        Transliterate a block of text. Everything except the Korean words is kept as it is.
+        With alignment the transliteration is returned together with its Alignment to the text.
+        """
+        if alignment:
+            return self.transliterate_text_aligned(text)
+        transliterate = self.transliterate_korean
+        return self.KOREAN_WORD.sub(lambda match: transliterate(match.group()), text)
+
+    def transliterate_text_profiled(self, text, alignment=False):
+        """ transliterate_text going through the profile, alignments are not profiled. """
+        if alignment:
+            return self.transliterate_text_aligned(text)
+        return self.profile.transliterate_text(self, text)
+
+    def transliterate_text_aligned(self, text):
+        """ Transliterate a block of text and return the transliteration and its Alignment to the text. """
+        syllable_fragments = self.syllable_fragments
+        unpack_syllables = self.unpack_syllables
+        parts = []
+        sources = array("I")
+        outputs = array("I")
+        # 1 for the segments copied from the text, 0 for the transliterated ones
+        copied = bytearray()
+        # Length of the transliteration so far
+        position = 0
+        end = 0
+        for match in self.KOREAN_WORD.finditer(text):
+            start = match.start()
+            if start != end:
+                sources.append(end)
+                outputs.append(position)
+                copied.append(1)
+                parts.append(text[end:start])
+                position += start - end
+            word = match.group()
+            pieces = self.match_exceptions(word) if self.exceptions is not None else None
+            if pieces is None:
+                if min(word) < "\uac00":
+                    pieces = self.compose_syllables(word)
+                else:
+                    pieces = [(word, unpack_syllables(word), None)]
+            for piece, indices, lengths in pieces:
+                fragments = syllable_fragments(indices) if indices is not None else [piece]
+                for i, fragment in enumerate(fragments):
+                    sources.append(start)
+                    outputs.append(position)
+                    # Jamos which are not part of a syllable are kept as they are
+                    copied.append(indices is None and lengths is None)
+                    parts.append(fragment)
+                    position += len(fragment)
+                    start += lengths[i] if lengths is not None else 1
+            end = start
+        if end != len(text):
+            sources.append(end)
+            outputs.append(position)
+            copied.append(1)
+            parts.append(text[end:])
+            position += len(text) - end
+        sources.append(len(text))
+        outputs.append(position)
+        return "".join(parts), Alignment(sources, outputs, copied)
+
+    def transliterate_stream(self, chunks):
+        """
+        Transliterate text arriving in chunks (e.g. read from a file) and yield the transliteration piece by piece.
+        Korean words spanning two chunks are held back until they end, so only the current chunk and
+        the unfinished word are kept in memory. The pieces joined together are equal to the
+        transliteration of the whole text.
+        """
+        pending = ""
+        for chunk in chunks:
+            text = pending + chunk
+            cut = len(text)
+            while cut > 0 and self.is_character_korean(text[cut - 1]):
+                cut -= 1
+            pending = text[cut:]
+            if cut > 0:
+                yield self.transliterate_text(text[:cut])
+        if pending:
+            yield self.transliterate_text(pending)
@@ -0,0 +1,163 @@
+from .hangul import Hangul
+
+
+class BlockOffsets:
+    """
+    Fenwick tree over the lengths of the blocks of a document, finding the block of an offset and
+    updating the length of a block in O(log(number of blocks)).
+    """
+
+    def __init__(self, lengths=()):
+        self.build(lengths)
+
+    def build(self, lengths):
+        """ Replace the lengths, in linear time. """
+        tree = [0] + list(lengths)
+        for i in range(1, len(tree)):
+            parent = i + (i & -i)
+            if parent < len(tree):
+                tree[parent] += tree[i]
+        self.tree = tree
+        self.count = len(tree) - 1
+        # Largest power of two up to count, where the searches start
+        self.step = 1 << (self.count.bit_length() - 1) if self.count else 0
+
+    def add(self, index, delta):
+        """ Add delta to the length of the block at index. """
+        tree = self.tree
+        i = index + 1
+        while i <= self.count:
+            tree[i] += delta
+            i += i & -i
+
+    def find(self, offset):
+        """
+        Return the index of the first block ending at offset or after it (the last block if the offset is
+        past the end) and the offset where that block starts.
+        """
+        tree = self.tree
+        # Number of blocks ending before offset, and the offset left after them
+        index = 0
+        remaining = offset
+        step = self.step
+        while step:
+            if index + step <= self.count and tree[index + step] < remaining:
+                index += step
+                remaining -= tree[index]
+            step >>= 1
+        if index == self.count and index > 0:
+            # Past the end, the last block is returned
+            index -= 1
+            remaining += self.length(index)
+        return index, offset - remaining
+
+    def length(self, index):
+        """ Return the length of the block at index. """
+        tree = self.tree
+        i = index + 1
+        length = tree[i]
+        # Subtract the blocks covered by tree[i] other than this one
+        lower = i - (i & -i)
+        i -= 1
+        while i > lower:
+            length -= tree[i]
+            i -= i & -i
+        return length
+
+
+class IncrementalTransliteration:
+    """
+    Keep the transliteration of a document up to date while it is being edited.
+    The document is held in blocks of about BLOCK_SIZE characters which end outside Korean words,
+    so an edit only transliterates again the blocks it touches (and the neighbouring block
+    when a Korean word now continues into it). The blocks of an offset are found in a BlockOffsets.
+    """
+    BLOCK_SIZE = 256
+
+    def __init__(self, text="", translator=None):
+        self.translator = translator if translator is not None else Hangul()
+        self.blocks = []
+        self.transliterations = []
+        self.offsets = BlockOffsets()
+        self.replace_blocks(0, 0, text)
+
+    @property
+    def text(self):
+        return "".join(self.blocks)
+
+    @property
+    def transliteration(self):
+        return "".join(self.transliterations)
+
+    def split(self, text, size=None):
+        """
+        Split a text into blocks of about size (BLOCK_SIZE by default) characters,
+        moving the cuts past the Korean words they would fall into.
+        """
+        size = size or self.BLOCK_SIZE
+        is_korean = self.translator.is_character_korean
+        blocks = []
+        start = 0
+        while len(text) - start > size:
+            cut = start + size
+            if is_korean(text[cut - 1]):
+                match = Hangul.KOREAN_WORD.match(text, cut)
+                if match is not None:
+                    cut = match.end()
+            blocks.append(text[start:cut])
+            start = cut
+        if start < len(text) or not blocks:
+            blocks.append(text[start:])
+        return blocks
+
+    def replace_blocks(self, first, last, text):
+        """ Replace the blocks from first up to (not including) last with the blocks of text. """
+        count = last - first
+        if 0 < count and len(text) <= 2 * self.BLOCK_SIZE * count:
+            # Blocks grow up to twice BLOCK_SIZE before they are split, so that typing keeps the number of blocks
+            blocks = [block for block in self.split(text, -(-len(text) // count)) if block]
+        else:
+            blocks = [block for block in self.split(text) if block]
+        if len(blocks) == count:
+            # Only new or removed blocks rebuild the offsets, which takes time linear in the number of blocks
+            for index, block in enumerate(blocks, first):
+                self.offsets.add(index, len(block) - len(self.blocks[index]))
+            self.blocks[first:last] = blocks
+        else:
+            self.blocks[first:last] = blocks
+            self.offsets.build(len(block) for block in self.blocks)
+        self.transliterations[first:last] = [self.translator.transliterate_text(block) for block in blocks]
+
+    def find_block(self, offset):
+        """ Return the index of the block containing offset and the offset where the block starts. """
+        return self.offsets.find(offset)
+
+    def edit(self, offset, length, text=""):
+        """ Replace length characters at offset with text. """
+        if not self.blocks:
+            first = last = start = 0
+            source = ""
+        else:
+            first, start = self.find_block(offset)
+            last, _ = self.find_block(offset + length)
+            last += 1
+            source = "".join(self.blocks[first:last])
+        if not 0 <= offset - start <= len(source) - length or length < 0:
+            raise IndexError("The edit is outside of the text")
+        source = source[:offset - start] + text + source[offset - start + length:]
+
+        # Korean words continuing into the neighbouring blocks are transliterated again as well
+        is_korean = self.translator.is_character_korean
+        if first > 0 and is_korean(self.blocks[first - 1][-1]) and (source == "" or is_korean(source[0])):
+            first -= 1
+            source = self.blocks[first] + source
+        if last < len(self.blocks) and is_korean(self.blocks[last][0]) and (source == "" or is_korean(source[-1])):
+            source += self.blocks[last]
+            last += 1
+        self.replace_blocks(first, last, source)
+
+    def insert(self, offset, text):
+        self.edit(offset, 0, text)
+
+    def delete(self, offset, length=1):
+        self.edit(offset, length)
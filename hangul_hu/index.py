@@ -0,0 +1,209 @@
+"""
+Search index of Korean text by the Hungarian transliteration of its words.
+The index is a directory of segment files, every flush writes a new segment so documents can be
+added at any time, compact merges the segments into one. A segment is memory-mapped and holds
+(little-endian):
+- header: magic, version, reserved, number of tokens
+- the tokens (UTF-8, sorted) as (count + 1) 32 bit offsets followed by the concatenated tokens
+- (count + 1) 32 bit offsets into the postings, followed by the postings,
+  which are (document, offset of the Korean word) pairs of 32 bit integers
+"""
+import glob
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+from .hangul import Hangul
+from .store import _integers, _offsets, _write_section
+
+MAGIC = b"HGIX"
+VERSION = 1
+HEADER = struct.Struct("<4sHHI")
+
+
+def write_segment(path, postings):
+    """ Write a segment file, postings maps tokens to arrays of (document, offset) pairs. """
+    entries = sorted((token.encode("utf-8"), pairs) for token, pairs in postings.items())
+    with open(path, mode="wb") as file:
+        file.write(HEADER.pack(MAGIC, VERSION, 0, len(entries)))
+        _write_section(file, [token for token, _ in entries])
+        offsets = array("I", [0])
+        for _, pairs in entries:
+            offsets.append(offsets[-1] + len(pairs) // 2)
+        values = array("I")
+        for _, pairs in entries:
+            values.extend(pairs)
+        if sys.byteorder == "big":
+            offsets.byteswap()
+            values.byteswap()
+        file.write(offsets.tobytes())
+        file.write(values.tobytes())
+
+
+class Segment:
+    def __init__(self, path):
+        self.path = path
+        with open(path, mode="rb") as file:
+            self.buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, _, count = HEADER.unpack_from(self.buffer)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("{} is not an index segment".format(path))
+        self.count = count
+        position = HEADER.size
+        self.token_offsets = _offsets(self.buffer, position, count)
+        self.token_start = position + 4 * (count + 1)
+        position = self.token_start + self.token_offsets[-1]
+        self.posting_offsets = _offsets(self.buffer, position, count)
+        position += 4 * (count + 1)
+        self.postings_values = _integers(self.buffer, position, self.posting_offsets[-1] * 2)
+
+    def __len__(self):
+        return self.count
+
+    def close(self):
+        # The memoryviews have to be released before the mapping can be closed
+        self.token_offsets = self.posting_offsets = self.postings_values = None
+        self.buffer.close()
+
+    def token_bytes(self, i):
+        return self.buffer[self.token_start + self.token_offsets[i]:self.token_start + self.token_offsets[i + 1]]
+
+    def token(self, i):
+        return self.token_bytes(i).decode("utf-8")
+
+    def find(self, key: bytes):
+        """ Return the index of the first token not less than key. """
+        low = 0
+        high = self.count
+        while low < high:
+            middle = (low + high) // 2
+            if self.token_bytes(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def postings(self, i):
+        """ Return the (document, offset) pairs of the i-th token. """
+        values = self.postings_values[self.posting_offsets[i] * 2:self.posting_offsets[i + 1] * 2]
+        return list(zip(values[0::2], values[1::2]))
+
+
+class SearchIndex:
+    def __init__(self, directory, translator=None):
+        self.directory = directory
+        self.translator = translator if translator is not None else Hangul(cache_size=65536)
+        os.makedirs(directory, exist_ok=True)
+        self.segments = [Segment(path) for path in sorted(glob.glob(os.path.join(directory, "segment-*.idx")))]
+        # Postings added since the last flush
+        self.pending = {}
+
+    def add(self, document, text):
+        """ Index the Korean words of a document, document being an integer identifier. """
+        transliterate = self.translator.transliterate_korean
+        pending = self.pending
+        for match in Hangul.KOREAN_WORD.finditer(text):
+            token = transliterate(match.group()).lower()
+            pairs = pending.get(token)
+            if pairs is None:
+                pairs = pending[token] = array("I")
+            pairs.append(document)
+            pairs.append(match.start())
+
+    def flush(self):
+        """ Write the documents added since the last flush into a new segment. """
+        if not self.pending:
+            return
+        number = int(os.path.basename(self.segments[-1].path)[8:-4]) + 1 if self.segments else 1
+        path = os.path.join(self.directory, "segment-{:06d}.idx".format(number))
+        write_segment(path, self.pending)
+        self.segments.append(Segment(path))
+        self.pending = {}
+
+    def compact(self):
+        """ Merge all the segments into one. """
+        self.flush()
+        if len(self.segments) < 2:
+            return
+        postings = {}
+        for segment in self.segments:
+            for i in range(len(segment)):
+                start = segment.posting_offsets[i] * 2
+                end = segment.posting_offsets[i + 1] * 2
+                postings.setdefault(segment.token(i), array("I")).extend(segment.postings_values[start:end])
+        old_segments = self.segments
+        number = int(os.path.basename(old_segments[-1].path)[8:-4]) + 1
+        path = os.path.join(self.directory, "segment-{:06d}.idx".format(number))
+        write_segment(path, postings)
+        for segment in old_segments:
+            segment.close()
+            os.remove(segment.path)
+        self.segments = [Segment(path)]
+
+    def close(self):
+        for segment in self.segments:
+            segment.close()
+        self.segments = []
+
+    def lookup(self, token):
+        """ Return the (document, offset) pairs of a transliterated word. """
+        token = token.lower()
+        key = token.encode("utf-8")
+        results = []
+        for segment in self.segments:
+            i = segment.find(key)
+            if i < len(segment) and segment.token_bytes(i) == key:
+                results.extend(segment.postings(i))
+        return results
+
+    def prefix(self, prefix):
+        """ Return the tokens starting with prefix and their (document, offset) pairs. """
+        key = prefix.lower().encode("utf-8")
+        results = {}
+        for segment in self.segments:
+            i = segment.find(key)
+            while i < len(segment) and segment.token_bytes(i).startswith(key):
+                results.setdefault(segment.token(i), []).extend(segment.postings(i))
+                i += 1
+        return results
+
+    def fuzzy(self, token, distance=1):
+        """
+        Return the tokens within the given edit distance of token and their (document, offset) pairs.
+        The sorted tokens are walked with one row of the edit distance table per character,
+        the rows of a common prefix are reused and the tokens of a prefix too far from token are skipped.
+        """
+        token = token.lower()
+        results = {}
+        for segment in self.segments:
+            rows = [list(range(len(token) + 1))]
+            previous = ""
+            i = 0
+            while i < len(segment):
+                current = segment.token(i)
+                common = 0
+                while common < min(len(previous), len(current)) and previous[common] == current[common]:
+                    common += 1
+                del rows[common + 1:]
+                pruned = None
+                for j in range(common, len(current)):
+                    above = rows[-1]
+                    row = [above[0] + 1]
+                    for k, character in enumerate(token):
+                        row.append(min(row[k] + 1, above[k + 1] + 1, above[k] + (character != current[j])))
+                    rows.append(row)
+                    if min(row) > distance:
+                        pruned = j + 1
+                        break
+                if pruned is not None:
+                    # No token starting with this prefix can be close enough
+                    previous = current[:pruned]
+                    i = segment.find(previous.encode("utf-8") + b"\xff")
+                    continue
+                if rows[-1][-1] <= distance:
+                    results.setdefault(current, []).extend(segment.postings(i))
+                previous = current
+                i += 1
+        return results
@@ -0,0 +1,116 @@
+import collections
+import itertools
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from .exceptions import Exceptions
+from .schemes import SCHEMES, Scheme, get_scheme, register
+
+# Backends of transliterate_many
+BACKENDS = ("processes", "threads")
+
+# Transliterator of the worker process, created by _initialize
+_translator = None
+# Transliterators of the other schemes, created on first use by _transliterate_schemes
+_translators = {}
+_options = None
+
+
+def _initialize(transition_table, cache_size, scheme=None, schemes=(), exceptions=None):
+    """
+    scheme is the definition (see Scheme.to_dict) of the scheme of the worker, schemes are registered
+    unless the worker already has them (built-in schemes, or all of them in a forked worker).
+    """
+    global _translator, _options
+    for definition in schemes:
+        if definition["name"] not in SCHEMES:
+            register(Scheme.from_dict(definition))
+    _options = {"transition_table": transition_table, "cache_size": cache_size, "exceptions": exceptions}
+    scheme = Scheme.from_dict(scheme) if scheme is not None else get_scheme(None)
+    _translator = scheme.translator(**_options)
+
+
+def _transliterate(text):
+    return _translator.transliterate_text(text)
+
+
+def _transliterate_schemes(pairs):
+    """ Transliterate (scheme name, text) pairs, None stands for the scheme of the worker. """
+    results = []
+    for name, text in pairs:
+        translator = _translator if name is None else _translators.get(name)
+        if translator is None:
+            translator = _translators[name] = get_scheme(name).translator(**_options)
+        results.append(translator.transliterate_text(text))
+    return results
+
+
+# Transliterator of every worker thread, created by _initialize_thread
+_local = threading.local()
+
+
+def _initialize_thread(scheme, transition_table, cache_size, exceptions):
+    # The tables are shared by the threads, the word caches are not, so that the threads do not contend for them
+    _local.translator = scheme.translator(transition_table, cache_size, exceptions=exceptions)
+
+
+def _transliterate_chunk(texts):
+    transliterate_text = _local.translator.transliterate_text
+    return [transliterate_text(text) for text in texts]
+
+
+def _transliterate_threads(texts, workers, chunksize, options):
+    """ Transliterate the texts in a pool of threads, keeping a few chunks per thread in flight. """
+    texts = iter(texts)
+    pending = collections.deque()
+    with ThreadPoolExecutor(workers, initializer=_initialize_thread, initargs=options) as executor:
+        while True:
+            chunk = list(itertools.islice(texts, chunksize))
+            if not chunk:
+                break
+            pending.append(executor.submit(_transliterate_chunk, chunk))
+            if len(pending) > 2 * workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def transliterate_many(texts, workers=None, chunksize=1, transition_table=False, cache_size=0, scheme=None,
+                       backend="processes", exceptions=None):
+    """
+    Transliterate the texts of an iterable in a pool of worker processes or threads (backend, see BACKENDS).
+    The transliterations are yielded in the order of the texts as soon as they are ready,
+    chunksize texts are sent to a worker at once. workers defaults to the number of CPUs.
+    transition_table, cache_size and exceptions are passed to the Hangul instance of every worker,
+    scheme is a scheme or the name of one (see schemes.get_scheme), exceptions an exception dictionary
+    or the path of one (see exceptions.Exceptions).
+    Threads share the compiled tables and only run in parallel on free-threaded Python builds.
+    The arguments are checked when the function is called, before the texts are iterated.
+    """
+    if backend not in BACKENDS:
+        raise ValueError("Unknown backend: {}".format(backend))
+    if workers is not None and workers < 1:
+        raise ValueError("The number of workers must be at least 1")
+    if chunksize < 1:
+        raise ValueError("The chunk size must be at least 1")
+    scheme = get_scheme(scheme)
+    if isinstance(exceptions, str):
+        exceptions = Exceptions.load(exceptions)
+    return _transliterate_many(texts, workers, chunksize, transition_table, cache_size, scheme, backend, exceptions)
+
+
+def _transliterate_many(texts, workers, chunksize, transition_table, cache_size, scheme, backend, exceptions):
+    if workers == 1:
+        translator = scheme.translator(transition_table, cache_size, exceptions=exceptions)
+        for text in texts:
+            yield translator.transliterate_text(text)
+        return
+    if backend == "threads":
+        yield from _transliterate_threads(texts, workers or os.cpu_count() or 1, chunksize,
+                                          (scheme, transition_table, cache_size, exceptions))
+        return
+    with multiprocessing.Pool(workers, initializer=_initialize,
+                              initargs=(transition_table, cache_size, scheme.to_dict(), (), exceptions)) as pool:
+        yield from pool.imap(_transliterate, texts, chunksize)
@@ -0,0 +1,175 @@
+import time
+import unicodedata
+
+from .hangul import Hangul
+
+# Rules in the order they are applied to a syllable, with the compiled table of each
+RULES = [("word_initial_consonants_with_vowel", "word_initial_table"),
+         ("syllable_final_consonants", "syllable_final_table"),
+         ("syllable_initial_consonants", "syllable_initial_table"),
+         ("transliterate_vowel", "vowel_table"),
+         ("word_final_consonants", "word_final_table")]
+STAGES = ["tokenize", "decompose", "rules", "emit"]
+
+
+class Profile:
+    """
+    Instrumentation of Hangul.transliterate_text, enabled by passing a Profile to Hangul.
+    The rules are evaluated through their compiled tables, so the calls of a rule are counted
+    per table entry, i.e. per context (jamos) the rule was applied to. The time spent finding
+    the Korean words (tokenize), splitting them into jamos (decompose), applying the rules and
+    joining the transliteration (emit) is added up as well.
+    Words are always transliterated with the rules, the store, the word cache and the transition table
+    are bypassed so that every word is counted. The entries of the exception dictionary are not counted.
+    engine is the class whose tables are used, Hangul or the engine of a scheme (see schemes.Scheme).
+    The counters are not locked, a profiled transliterator must not be shared between threads.
+    """
+
+    def __init__(self, engine=Hangul):
+        self.engine = engine
+        engine.compile_tables()
+        self.counts = {rule: [0] * len(getattr(engine, table)) for rule, table in RULES}
+        self.times = dict.fromkeys(STAGES, 0.0)
+        self.texts = 0
+        self.words = 0
+        self.syllables = 0
+
+    def transliterate_text(self, translator, text):
+        """ Same as Hangul.transliterate_text, while counting the rules and timing the stages. """
+        start = time.perf_counter()
+        matches = list(translator.KOREAN_WORD.finditer(text))
+        tokenized = time.perf_counter()
+        words = []
+        for match in matches:
+            word = match.group()
+            # The entries of the exception dictionary are kept as they are, only the rest goes through the rules
+            pieces = translator.match_exceptions(word) if translator.exceptions is not None else None
+            if pieces is not None:
+                words.append(pieces)
+                continue
+            if min(word) < "\uac00":
+                word = unicodedata.normalize("NFC", word)
+            if min(word) < "\uac00":
+                words.append(translator.compose_syllables(word))
+            else:
+                words.append([(word, translator.unpack_syllables(word), None)])
+        decomposed = time.perf_counter()
+        transliterations = ["".join(piece if indices is None else self.transliterate_indices(indices)
+                                    for piece, indices, _ in pieces) for pieces in words]
+        ruled = time.perf_counter()
+        parts = []
+        end = 0
+        for match, transliteration in zip(matches, transliterations):
+            parts.append(text[end:match.start()])
+            parts.append(transliteration)
+            end = match.end()
+        parts.append(text[end:])
+        transliteration = "".join(parts)
+        emitted = time.perf_counter()
+
+        times = self.times
+        times["tokenize"] += tokenized - start
+        times["decompose"] += decomposed - tokenized
+        times["rules"] += ruled - decomposed
+        times["emit"] += emitted - ruled
+        self.texts += 1
+        self.words += sum(indices is not None for pieces in words for _, indices, _ in pieces)
+        return transliteration
+
+    def transliterate_indices(self, word):
+        """ Same as Hangul.transliterate_indices, while counting the table entries used. """
+        engine = self.engine
+        word_initial = engine.word_initial_table
+        syllable_initial = engine.syllable_initial_table
+        vowel = engine.vowel_table
+        word_final = engine.word_final_table
+        syllable_final = engine.syllable_final_table
+        counts = self.counts
+        word_initial_counts = counts["word_initial_consonants_with_vowel"]
+        syllable_initial_counts = counts["syllable_initial_consonants"]
+        vowel_counts = counts["transliterate_vowel"]
+        word_final_counts = counts["word_final_consonants"]
+        syllable_final_counts = counts["syllable_final_consonants"]
+        VCount = Hangul.VCount
+        LVCount = Hangul.LCount * VCount
+        parts = []
+
+        previous_t = None
+        for l, v, t in zip(word[0::3], word[1::3], word[2::3]):
+            lv = l * VCount + v
+            if previous_t is None:
+                parts.append(word_initial[lv])
+                word_initial_counts[lv] += 1
+            else:
+                context = previous_t * LVCount + lv
+                # Like the rules, the final consonant is only looked at when there is a batchim
+                if previous_t != 0:
+                    syllable_final_counts[context] += 1
+                parts.append(syllable_final[context])
+                parts.append(syllable_initial[context])
+                syllable_initial_counts[context] += 1
+            parts.append(vowel[v])
+            vowel_counts[v] += 1
+            previous_t = t
+        if previous_t:
+            parts.append(word_final[previous_t])
+            word_final_counts[previous_t] += 1
+        self.syllables += len(word) // 3
+
+        return "".join(parts)
+
+    @staticmethod
+    def context(rule, index):
+        """ Describe the jamos a table entry of a rule stands for, | separates the batchim from the next syllable. """
+        VCount = Hangul.VCount
+        LVCount = Hangul.LCount * VCount
+        if rule == "word_initial_consonants_with_vowel":
+            return Hangul.JLT[index // VCount] + Hangul.JVT[index % VCount]
+        if rule == "transliterate_vowel":
+            return Hangul.JVT[index]
+        if rule == "word_final_consonants":
+            return Hangul.JTT_MERGED[index]
+        lv = index % LVCount
+        return "{}|{}{}".format(Hangul.JTT_MERGED[index // LVCount] or "-", Hangul.JLT[lv // VCount],
+                                Hangul.JVT[lv % VCount])
+
+    def report(self, limit=None):
+        """
+        Return the counts and times as a dictionary (which can be saved as JSON),
+        with the contexts of every rule sorted by their number of calls, at most limit of them.
+        """
+        rules = {}
+        for rule, table in RULES:
+            counts = self.counts[rule]
+            outputs = getattr(self.engine, table)
+            used = sorted((i for i, count in enumerate(counts) if count), key=lambda i: -counts[i])
+            rules[rule] = {
+                "calls": sum(counts),
+                "contexts": len(used),
+                "hot": [{"context": self.context(rule, i), "output": outputs[i], "calls": counts[i]}
+                        for i in used[:limit]],
+            }
+        return {
+            "texts": self.texts,
+            "words": self.words,
+            "syllables": self.syllables,
+            "stages": dict(self.times),
+            "rules": rules,
+        }
+
+    def format_report(self, limit=10):
+        """ Return the report as a table meant to be read by humans. """
+        report = self.report(limit)
+        total = sum(report["stages"].values()) or 1
+        lines = ["{} texts, {} words, {} syllables".format(report["texts"], report["words"], report["syllables"]),
+                 "",
+                 "{:<12}{:>12}{:>8}".format("stage", "seconds", "share")]
+        for stage, seconds in report["stages"].items():
+            lines.append("{:<12}{:>12.4f}{:>8.1%}".format(stage, seconds, seconds / total))
+        for rule, counts in report["rules"].items():
+            lines.append("")
+            lines.append("{}: {} calls, {} contexts".format(rule, counts["calls"], counts["contexts"]))
+            for entry in counts["hot"]:
+                lines.append("  {:<8}{:<10}{:>12}".format(entry["context"], entry["output"] or "(none)",
+                                                         entry["calls"]))
+        return "\n".join(lines)
@@ -0,0 +1,132 @@
+"""
+Transliteration schemes, variants of the transliteration which share the rules of Hangul.
+A scheme is defined by a dictionary (or a JSON file holding one):
+    {"name": "house", "vowels": {"ㅐ": "e"}, "replace": [["cs", "ch"]]}
+- vowels: transliteration of vowels instead of the one of transliterate_vowel
+- replace: (old, new) pairs replaced in this order in the transliteration of every other jamo
+The tables of a scheme are compiled from the ones of Hangul on first use and kept by its engine,
+a subclass of Hangul, so any number of schemes can be used at the same time and switching
+between them costs nothing once their tables are compiled.
+"""
+import os
+
+from .hangul import Hangul
+
+# Class attributes compiled by Hangul, a scheme engine compiles its own
+COMPILED = ["syllable_indices", "word_initial_table", "syllable_initial_table", "vowel_table", "word_final_table",
+            "syllable_final_table", "transition_fragments", "transition_offsets", "transition_strides",
+            "transition_previous_classes", "transition_next_classes", "transition_build_time"]
+
+
+class Scheme:
+    def __init__(self, name, vowels=None, replace=()):
+        self.name = name
+        self.vowels = dict(vowels or {})
+        self.replace = [tuple(pair) for pair in replace]
+        for vowel in self.vowels:
+            if vowel not in Hangul.VIndices:
+                raise ValueError("{} is not a vowel".format(vowel))
+        self._engine = None
+
+    @classmethod
+    def from_dict(cls, definition):
+        return cls(definition["name"], definition.get("vowels"), definition.get("replace", ()))
+
+    def to_dict(self):
+        return {"name": self.name, "vowels": self.vowels, "replace": [list(pair) for pair in self.replace]}
+
+    def digest(self):
+        """ Hash of the definition, store files (see store) saved with this scheme can only be used with it. """
+        # Imported here, like json, they are not needed to transliterate with a scheme
+        import hashlib
+        import json
+        definition = json.dumps(self.to_dict(), sort_keys=True, ensure_ascii=False)
+        return hashlib.blake2b(definition.encode("utf-8"), digest_size=16).digest()
+
+    @classmethod
+    def load(cls, path):
+        """ Read a scheme from a JSON file. """
+        import json
+        with open(path, mode="r", encoding="utf-8") as file:
+            return cls.from_dict(json.load(file))
+
+    @property
+    def engine(self):
+        """ The Hangul class transliterating with this scheme, Hangul itself if the scheme changes nothing. """
+        if self._engine is None:
+            # Threads creating translators at once must share one engine, the tables are compiled per engine
+            with Hangul.compile_lock:
+                if self._engine is not None:
+                    pass
+                elif not self.vowels and not self.replace:
+                    self._engine = Hangul
+                else:
+                    attributes = dict.fromkeys(COMPILED)
+                    attributes["scheme"] = self
+                    self._engine = type("Hangul[{}]".format(self.name), (Hangul,), attributes)
+        return self._engine
+
+    def translator(self, *args, **kwargs):
+        """ Create a transliterator of this scheme, the arguments are the ones of Hangul. """
+        return self.engine(*args, **kwargs)
+
+    def transform(self, string):
+        for old, new in self.replace:
+            string = string.replace(old, new)
+        return string
+
+    def compile_tables(self, engine):
+        """ Set the tables of an engine of this scheme from the compiled tables of Hangul. """
+        engine.syllable_indices = Hangul.syllable_indices
+        engine.word_initial_table = tuple(self.transform(string) for string in Hangul.word_initial_table)
+        engine.syllable_initial_table = tuple(self.transform(string) for string in Hangul.syllable_initial_table)
+        engine.word_final_table = tuple(self.transform(string) for string in Hangul.word_final_table)
+        engine.syllable_final_table = tuple(self.transform(string) for string in Hangul.syllable_final_table)
+        # Set last, it marks the tables as compiled
+        engine.vowel_table = tuple(self.vowels[vowel] if vowel in self.vowels else self.transform(string)
+                                   for vowel, string in zip(Hangul.JVT, Hangul.vowel_table))
+
+
+SCHEMES = {}
+# Real path of a JSON file -> the scheme loaded from it
+LOADED = {}
+
+
+def register(scheme):
+    """ Make a scheme available by its name, which must not be the name of another scheme. """
+    if SCHEMES.get(scheme.name, scheme) is not scheme:
+        raise ValueError("There is already a scheme named {}".format(scheme.name))
+    SCHEMES[scheme.name] = scheme
+    return scheme
+
+
+def get_scheme(scheme):
+    """
+    Return a scheme given by itself, by its name or by the path of its JSON file (None is the default scheme).
+    A file is only read the first time its path is given.
+    """
+    if scheme is None:
+        return SCHEMES["hungarian"]
+    if isinstance(scheme, Scheme):
+        return scheme
+    if scheme in SCHEMES:
+        return SCHEMES[scheme]
+    if scheme.endswith(".json"):
+        path = os.path.realpath(scheme)
+        loaded = LOADED.get(path)
+        if loaded is None:
+            # Threads asking for the same file at once must register it once
+            with Hangul.compile_lock:
+                loaded = LOADED.get(path)
+                if loaded is None:
+                    loaded = LOADED[path] = register(Scheme.load(path))
+        return loaded
+    raise ValueError("Unknown scheme: {}".format(scheme))
+
+
+# The rules as they are
+register(Scheme("hungarian"))
+# The alternatives given for ㅐ and ㅒ in transliterate_vowel
+register(Scheme("hungarian-e", vowels={"ㅐ": "e", "ㅒ": "je"}))
+# Only ASCII letters, the accents are dropped
+register(Scheme("ascii", replace=[("á", "a"), ("é", "e"), ("ü", "u")]))
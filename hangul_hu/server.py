@@ -0,0 +1,238 @@
+"""
+HTTP/JSON transliteration service built on asyncio.
+POST /transliterate with {"text": ...} answers {"transliteration": ...}, GET /stats answers the counters.
+A request can choose a registered scheme with {"text": ..., "scheme": name} (see schemes).
+Concurrent requests are collected into batches which are transliterated in a process pool,
+so the event loop only handles the connections. Requests wait in a bounded queue,
+when it is full new requests wait until there is room in it.
+Run with: python -m hangul_hu.server [--host HOST] [--port PORT]
+"""
+import asyncio
+import collections
+import json
+import os
+import signal
+import time
+from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor
+
+from .exceptions import Exceptions
+from .parallel import _initialize, _transliterate_schemes
+from .schemes import SCHEMES, get_scheme
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+           500: "Internal Server Error"}
+
+
+class Server:
+    def __init__(self, host="127.0.0.1", port=8080, workers=None, batch_size=64, batch_delay=0.002,
+                 queue_size=1024, transition_table=False, cache_size=0, scheme=None, exceptions=None):
+        self.host = host
+        self.port = port
+        self.workers = workers
+        # A batch is sent to the pool when it has batch_size texts or batch_delay seconds passed since its first text
+        self.batch_size = batch_size
+        self.batch_delay = batch_delay
+        self.queue_size = queue_size
+        self.transition_table = transition_table
+        self.cache_size = cache_size
+        # Scheme of the requests which do not choose one
+        self.scheme = get_scheme(scheme)
+        # Exception dictionary of every scheme (see exceptions.Exceptions, or the path of one), read once here
+        self.exceptions = Exceptions.load(exceptions) if isinstance(exceptions, str) else exceptions
+        self.queue = None
+        self.pool = None
+        self.server = None
+        self.batchers = []
+        # Writers of the open connections
+        self.connections = set()
+        self.started = None
+        self.requests = 0
+        self.batches = 0
+        self.errors = 0
+        # Latencies of the last requests in seconds
+        self.latencies = collections.deque(maxlen=10000)
+
+    async def start(self):
+        """ Start the pool, the batchers and listening, returns the port the server listens on. """
+        self.queue = asyncio.Queue(self.queue_size)
+        workers = self.workers or os.cpu_count()
+        self.pool = ProcessPoolExecutor(workers, initializer=_initialize,
+                                        initargs=(self.transition_table, self.cache_size, self.scheme.to_dict(),
+                                                  [scheme.to_dict() for scheme in SCHEMES.values()], self.exceptions))
+        # Start the workers before listening, forked workers would keep the connections open otherwise
+        try:
+            await asyncio.get_running_loop().run_in_executor(self.pool, _transliterate_schemes, [])
+        except BaseException:
+            self.pool.shutdown()
+            raise
+        # One batcher per worker process keeps all of them busy
+        self.batchers = [asyncio.create_task(self.batcher()) for _ in range(workers)]
+        self.server = await asyncio.start_server(self.handle, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+        self.started = time.perf_counter()
+        return self.port
+
+    async def stop(self):
+        self.server.close()
+        for writer in list(self.connections):
+            writer.close()
+        await self.server.wait_closed()
+        for batcher in self.batchers:
+            batcher.cancel()
+        await asyncio.gather(*self.batchers, return_exceptions=True)
+        self.pool.shutdown()
+
+    async def serve_forever(self):
+        """ Serve until SIGINT or SIGTERM, then stop the pool and the connections. """
+        await self.start()
+        stopped = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for signal_number in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(signal_number, stopped.set)
+            except NotImplementedError:
+                # Not available on Windows, Ctrl+C still stops the server with KeyboardInterrupt
+                pass
+        try:
+            await stopped.wait()
+        finally:
+            await self.stop()
+
+    async def transliterate(self, text, scheme=None):
+        """ Queue a text and wait for its transliteration, scheme is the name of a registered scheme. """
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((text, scheme, future))
+        return await future
+
+    async def batcher(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            deadline = loop.time() + self.batch_delay
+            while len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            self.batches += 1
+            try:
+                results = await loop.run_in_executor(self.pool, _transliterate_schemes,
+                                                     [(scheme, text) for text, scheme, _ in batch])
+            except Exception as error:
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(error)
+                continue
+            for (_, _, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+
+    def stats(self):
+        """ Return the counters and the latency percentiles in milliseconds. """
+        latencies = sorted(self.latencies)
+        elapsed = time.perf_counter() - self.started
+
+        def percentile(p):
+            if not latencies:
+                return None
+            return latencies[min(len(latencies) - 1, int(p / 100 * len(latencies)))] * 1000
+
+        return {
+            "requests": self.requests,
+            "batches": self.batches,
+            "errors": self.errors,
+            "queued": self.queue.qsize(),
+            "requests_per_second": self.requests / elapsed if elapsed > 0 else 0,
+            "latency_ms": {"p50": percentile(50), "p90": percentile(90), "p99": percentile(99)},
+        }
+
+    async def respond(self, method, path, body):
+        """ Return the status and the JSON answer of a request. """
+        if path == "/stats":
+            if method != "GET":
+                return 405, {"error": "Use GET"}
+            return 200, self.stats()
+        if path != "/transliterate":
+            return 404, {"error": "Unknown path"}
+        if method != "POST":
+            return 405, {"error": "Use POST"}
+        try:
+            request = json.loads(body)
+            text = request["text"]
+            scheme = request.get("scheme")
+            if not isinstance(text, str) or not (scheme is None or isinstance(scheme, str)):
+                raise TypeError
+        except (ValueError, KeyError, TypeError, AttributeError):
+            return 400, {"error": "The body must be a JSON object with a text string"}
+        if scheme is not None and scheme not in SCHEMES:
+            return 400, {"error": "Unknown scheme"}
+        start = time.perf_counter()
+        transliteration = await self.transliterate(text, scheme)
+        self.latencies.append(time.perf_counter() - start)
+        self.requests += 1
+        return 200, {"transliteration": transliteration}
+
+    async def handle(self, reader, writer):
+        """ Serve the HTTP/1.1 requests of a connection. """
+        self.connections.add(writer)
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path, _ = request_line.decode("latin-1").split(" ", 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+                try:
+                    status, answer = await self.respond(method, path, body)
+                except Exception as error:
+                    # Set on the future of the batch, e.g. BrokenProcessPool when a worker died
+                    status, answer = 500, {"error": "{}: {}".format(type(error).__name__, error)}
+                if status != 200:
+                    self.errors += 1
+                content = json.dumps(answer, ensure_ascii=False).encode("utf-8")
+                writer.write("HTTP/1.1 {} {}\r\nContent-Type: application/json; charset=utf-8\r\n"
+                             "Content-Length: {}\r\n\r\n".format(status, REASONS[status], len(content))
+                             .encode("latin-1") + content)
+                await writer.drain()
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (ConnectionError, ValueError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self.connections.discard(writer)
+            writer.close()
+
+
+def main(argv=None):
+    parser = ArgumentParser("Serve the transliteration over HTTP.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--workers", type=int, default=None, help="Number of worker processes.")
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--queue-size", type=int, default=1024)
+    parser.add_argument("--scheme", action="append", default=[],
+                        help="Name or JSON file of a scheme, the first one is the default (can be repeated).")
+    parser.add_argument("--exceptions", default=None, help="Exception dictionary file (see exceptions).")
+    args = parser.parse_args(argv)
+    schemes = [get_scheme(scheme) for scheme in args.scheme]
+    try:
+        server = Server(args.host, args.port, args.workers, args.batch_size, queue_size=args.queue_size,
+                        scheme=schemes[0] if schemes else None, exceptions=args.exceptions)
+    except (ValueError, OSError) as error:
+        parser.error("Can not load the exceptions: {}".format(error))
+    asyncio.run(server.serve_forever())
+
+
+if __name__ == "__main__":
+    main()
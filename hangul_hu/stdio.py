@@ -0,0 +1,82 @@
+"""
+Co-process mode: JSON Lines requests on the standard input, JSON Lines answers on the standard output,
+so that programs written in other languages start the transliterator once and keep it running.
+A request is {"id": ..., "text": ...} or {"id": ..., "texts": [...]}, optionally with
+"options": {"scheme": name} (see schemes), and is answered with {"id": ..., "transliteration": ...}
+({"id": ..., "transliterations": [...]}) or {"id": ..., "error": ...}.
+Requests can be sent without waiting for the answers, which come in the order of the requests.
+Whatever is available on the input is read at once and answered with a single write.
+Run with: python Transliterator.py --serve-stdio
+"""
+import json
+import sys
+
+from .schemes import SCHEMES, get_scheme
+
+# Number of bytes read from the input at once at most
+CHUNK_SIZE = 1 << 16
+
+
+class StdioServer:
+    def __init__(self, translator, input_stream=None, output_stream=None):
+        # Transliterator of the requests without a scheme, the others are created on first use
+        self.translator = translator
+        self.translators = {}
+        self.input_stream = input_stream if input_stream is not None else sys.stdin.buffer
+        self.output_stream = output_stream if output_stream is not None else sys.stdout.buffer
+
+    def get_translator(self, scheme):
+        if scheme is None:
+            return self.translator
+        translator = self.translators.get(scheme)
+        if translator is None:
+            translator = self.translators[scheme] = get_scheme(scheme).translator(
+                cache_size=self.translator.cache_size, exceptions=self.translator.exceptions)
+        return translator
+
+    def answer(self, line):
+        """ Answer a request line. """
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise TypeError
+        except (ValueError, TypeError):
+            return {"id": None, "error": "A request must be a JSON object"}
+        answer = {"id": request.get("id")}
+        options = request.get("options") or {}
+        scheme = options.get("scheme") if isinstance(options, dict) else None
+        if scheme is not None and scheme not in SCHEMES:
+            answer["error"] = "Unknown scheme"
+            return answer
+        transliterate_text = self.get_translator(scheme).transliterate_text
+        text = request.get("text")
+        texts = request.get("texts")
+        if isinstance(text, str):
+            answer["transliteration"] = transliterate_text(text)
+        elif isinstance(texts, list) and all(isinstance(text, str) for text in texts):
+            answer["transliterations"] = [transliterate_text(text) for text in texts]
+        else:
+            answer["error"] = "A request must have a text string or a texts list of strings"
+        return answer
+
+    def write(self, lines):
+        answers = [json.dumps(self.answer(line), ensure_ascii=False) for line in lines if line.strip()]
+        if answers:
+            self.output_stream.write(("\n".join(answers) + "\n").encode("utf-8"))
+            self.output_stream.flush()
+
+    def serve(self):
+        """ Answer the requests until the end of the input. """
+        # Start of the line being read
+        pending = []
+        while True:
+            # read1 returns what is available instead of waiting for CHUNK_SIZE bytes
+            data = self.input_stream.read1(CHUNK_SIZE)
+            if not data:
+                break
+            pending.append(data)
+            if b"\n" in data:
+                lines = b"".join(pending).split(b"\n")
+                pending = [lines.pop()]
+                self.write(lines)
+        self.write([b"".join(pending)])
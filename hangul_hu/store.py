@@ -0,0 +1,110 @@
+"""
+Store file holding the compiled rule tables and the transliteration of frequent words.
+Layout (little-endian):
+- header: magic, version, reserved, number of table strings, number of words,
+  digest and length of the name of the scheme the store was saved with, followed by the name (UTF-8)
+- table strings, words (UTF-8, sorted) and their transliterations, each section being
+  (count + 1) 32 bit offsets followed by the concatenated strings
+The file is memory-mapped, the words are read into a dict the first time one is looked up.
+"""
+import mmap
+import struct
+import sys
+from array import array
+
+MAGIC = b"HGHU"
+VERSION = 2
+HEADER = struct.Struct("<4sHHII16sH")
+
+
+def _integers(buffer, position, count):
+    """ Read count 32 bit integers starting at position. """
+    integers = memoryview(buffer)[position:position + 4 * count]
+    if sys.byteorder == "little":
+        return integers.cast("I")
+    integers = array("I", integers)
+    integers.byteswap()
+    return integers
+
+
+def _offsets(buffer, position, count):
+    """ Read count + 1 offsets starting at position. """
+    return _integers(buffer, position, count + 1)
+
+
+def _write_section(file, strings):
+    offsets = array("I", [0])
+    for string in strings:
+        offsets.append(offsets[-1] + len(string))
+    if sys.byteorder == "big":
+        offsets.byteswap()
+    file.write(offsets.tobytes())
+    file.write(b"".join(strings))
+
+
+def write_store(path, tables, words, scheme=("hungarian", bytes(16))):
+    """
+    Write a store file.
+    tables is the list of the table strings, words maps Korean words to their transliteration,
+    scheme is the name and the digest of the scheme of both (see Hangul.scheme_identity).
+    """
+    table_strings = [string.encode("utf-8") for string in tables]
+    entries = sorted((word.encode("utf-8"), transliteration.encode("utf-8"))
+                     for word, transliteration in words.items())
+    with open(path, mode="wb") as file:
+        name = scheme[0].encode("utf-8")
+        file.write(HEADER.pack(MAGIC, VERSION, 0, len(table_strings), len(entries), scheme[1], len(name)))
+        file.write(name)
+        _write_section(file, table_strings)
+        _write_section(file, [word for word, _ in entries])
+        _write_section(file, [transliteration for _, transliteration in entries])
+
+
+class Store:
+    def __init__(self, path):
+        with open(path, mode="rb") as file:
+            self.buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, _, table_count, word_count, digest, name_length = HEADER.unpack_from(self.buffer)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("{} is not a transliteration store".format(path))
+        self.word_count = word_count
+        position = HEADER.size
+        # Name and digest of the scheme of the tables and the transliterations
+        self.scheme = (self.buffer[position:position + name_length].decode("utf-8"), digest)
+        position += name_length
+        self.table_offsets = _offsets(self.buffer, position, table_count)
+        self.table_start = position + 4 * (table_count + 1)
+        position = self.table_start + self.table_offsets[-1]
+        self.word_offsets = _offsets(self.buffer, position, word_count)
+        self.word_start = position + 4 * (word_count + 1)
+        position = self.word_start + self.word_offsets[-1]
+        self.transliteration_offsets = _offsets(self.buffer, position, word_count)
+        self.transliteration_start = position + 4 * (word_count + 1)
+        # Words and their transliteration, read by get on first use
+        self.entries = None
+
+    def tables(self):
+        """ Return the table strings. """
+        offsets = self.table_offsets
+        start = self.table_start
+        return [self.buffer[start + offsets[i]:start + offsets[i + 1]].decode("utf-8")
+                for i in range(len(offsets) - 1)]
+
+    def words(self):
+        """ Return a dict of the words of the store and their transliteration. """
+        buffer = self.buffer
+        words = buffer[self.word_start:self.word_start + self.word_offsets[-1]]
+        transliterations = buffer[self.transliteration_start:self.transliteration_start + self.transliteration_offsets[-1]]
+        word_offsets = self.word_offsets
+        transliteration_offsets = self.transliteration_offsets
+        return {words[word_offsets[i]:word_offsets[i + 1]].decode("utf-8"):
+                transliterations[transliteration_offsets[i]:transliteration_offsets[i + 1]].decode("utf-8")
+                for i in range(self.word_count)}
+
+    def get(self, word):
+        """ Return the transliteration of a word, None if the word is not in the store. """
+        entries = self.entries
+        if entries is None:
+            # Read on first use, tables are all that is needed to start. A race builds the same dict twice
+            entries = self.entries = self.words()
+        return entries.get(word)
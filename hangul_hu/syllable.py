@@ -0,0 +1,75 @@
+class Syllable:
+    __slots__ = ("leading_consonant", "vowel", "batchim")
+
+    def __init__(self, c1, c2, c3):
+        self.leading_consonant = c1
+        self.vowel = c2
+        self.batchim = c3
+
+
+class Complex:
+    __slots__ = ("first", "second")
+
+    def __init__(self, first, second):
+        self.first = first
+        self.second = second
+
+    @staticmethod
+    def is_complex(consonant):
+        return consonant in ["ㄳ", "ㄵ", "ㄶ", "ㄺ", "ㄻ", "ㄼ", "ㄽ", "ㄾ", "ㄿ", "ㅀ", "ㅄ"]
+
+    @staticmethod
+    def merge_characters(characters):
+        """ Merge complex Korean characters. """
+        if characters == "ㄱㅅ":
+            return "ㄳ"
+        elif characters == "ㄴㅈ":
+            return "ㄵ"
+        elif characters == "ㄴㅎ":
+            return "ㄶ"
+        elif characters == "ㄹㄱ":
+            return "ㄺ"
+        elif characters == "ㄹㅁ":
+            return "ㄻ"
+        elif characters == "ㄹㅂ":
+            return "ㄼ"
+        elif characters == "ㄹㅅ":
+            return "ㄽ"
+        elif characters == "ㄹㅌ":
+            return "ㄾ"
+        elif characters == "ㄹㅍ":
+            return "ㄿ"
+        elif characters == "ㄹㅎ":
+            return "ㅀ"
+        elif characters == "ㅂㅅ":
+            return "ㅄ"
+        else:
+            raise ValueError
+
+    @staticmethod
+    def separate_characters(character):
+        """ Separate complex Korean characters. """
+        if character == "ㄳ":
+            return Complex("ㄱ", "ㅅ")
+        elif character == "ㄵ":
+            return Complex("ㄴ", "ㅈ")
+        elif character == "ㄶ":
+            return Complex("ㄴ", "ㅎ")
+        elif character == "ㄺ":
+            return Complex("ㄹ", "ㄱ")
+        elif character == "ㄻ":
+            return Complex("ㄹ", "ㅁ")
+        elif character == "ㄼ":
+            return Complex("ㄹ", "ㅂ")
+        elif character == "ㄽ":
+            return Complex("ㄹ", "ㅅ")
+        elif character == "ㄾ":
+            return Complex("ㄹ", "ㅌ")
+        elif character == "ㄿ":
+            return Complex("ㄹ", "ㅍ")
+        elif character == "ㅀ":
+            return Complex("ㄹ", "ㅎ")
+        elif character == "ㅄ":
+            return Complex("ㅂ", "ㅅ")
+        else:
+            raise ValueError
@@ -0,0 +1,59 @@
+"""
+NumPy implementation of Hangul.transliterate_text for large text buffers.
+The text is converted to an array of code points, and the jamo indices, the word boundaries and
+the table lookups are computed for the whole array at once. Without NumPy the pure Python
+implementation is used.
+"""
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from .hangul import Hangul
+
+
+def decompose(text):
+    """
+    Return the Korean mask and the leading consonant, vowel and batchim index arrays of a text.
+    The indices of characters which are not Korean syllables are 0.
+    """
+    SIndex = numpy.frombuffer(text.encode("utf-32-le"), dtype="<u4").astype(numpy.int32) - Hangul.SBase
+    korean = (SIndex >= 0) & (SIndex < Hangul.SCount)
+    SIndex[~korean] = 0
+    return korean, SIndex // Hangul.NCount, (SIndex % Hangul.NCount) // Hangul.TCount, SIndex % Hangul.TCount
+
+
+def transliterate_text(text, translator=None):
+    """ Transliterate a block of text, the result is the same as the one of Hangul.transliterate_text. """
+    if translator is None:
+        translator = Hangul()
+    if numpy is None or not text:
+        return translator.transliterate_text(text)
+    # Jamos are composed into syllables and exceptions are matched by the pure Python implementation only
+    if translator.exceptions is not None or not Hangul.JAMO.isdisjoint(text):
+        return translator.transliterate_text(text)
+    translator.compile_tables()
+    # Hangul or the engine of a scheme
+    engine = type(translator)
+    LCount, VCount, TCount = Hangul.LCount, Hangul.VCount, Hangul.TCount
+    korean, l, v, t = decompose(text)
+
+    # Word boundaries, a syllable is word-initial (word-final) if the character before (after) it is not Korean
+    previous_korean = numpy.zeros_like(korean)
+    previous_korean[1:] = korean[:-1]
+    next_korean = numpy.zeros_like(korean)
+    next_korean[:-1] = korean[1:]
+
+    # Word-initial and syllable-initial (word-final and syllable-final) tables are looked up from one array
+    initials = numpy.array(engine.word_initial_table + engine.syllable_initial_table, dtype=object)
+    finals = numpy.array(engine.word_final_table + engine.syllable_final_table, dtype=object)
+    vowels = numpy.array(engine.vowel_table, dtype=object)
+    lv = l * VCount + v
+    initial = numpy.where(previous_korean, LCount * VCount + numpy.roll(t, 1) * LCount * VCount + lv, lv)
+    final = numpy.where(next_korean, TCount + t * LCount * VCount + numpy.roll(lv, -1), t)
+
+    pieces = numpy.empty((len(korean), 3), dtype=object)
+    pieces[:, 0] = numpy.where(korean, initials[initial], numpy.array(list(text), dtype=object))
+    pieces[:, 1] = numpy.where(korean, vowels[v], "")
+    pieces[:, 2] = numpy.where(korean, finals[final], "")
+    return "".join(pieces.ravel().tolist())
@@ -0,0 +1,83 @@
+"""
+The exception dictionary: leftmost-longest matching of its entries, and the entries matched over
+syllables composed of jamos, with the same result with and without the alignment.
+"""
+import random
+import unicodedata
+
+import pytest
+
+from hangul_hu import Exceptions, Hangul
+
+ENTRIES = {"서울": "Szöul", "서울역": "SZÖULJAK", "한국": "Hanguk", "국어": "X", "대한민국": "Korea"}
+
+
+def test_split():
+    exceptions = Exceptions(ENTRIES)
+    assert exceptions.split("안녕") is None
+    assert exceptions.split("서울") == [("서울", "Szöul")]
+    # The longest entry starting at a syllable is taken
+    assert exceptions.split("서울역에") == [("서울역", "SZÖULJAK"), ("에", None)]
+    # Searched from left to right, 국어 overlaps 한국 and is not matched
+    assert exceptions.split("한국어") == [("한국", "Hanguk"), ("어", None)]
+    assert exceptions.split("미국어") == [("미", None), ("국어", "X")]
+    assert exceptions.split("서울에서울") == [("서울", "Szöul"), ("에", None), ("서울", "Szöul")]
+
+
+def test_prefix_nodes():
+    exceptions = Exceptions(ENTRIES)
+    # 대, 대한 and 대한민 are nodes of the trie, not entries
+    assert exceptions.get("대한") is None
+    assert exceptions.split("대한") is None
+    assert exceptions.split("대한민") is None
+    assert exceptions.split("대한민국") == [("대한민국", "Korea")]
+    # A prefix which is not an entry does not hide an entry starting after it
+    assert exceptions.split("대서울") == [("대", None), ("서울", "Szöul")]
+    assert exceptions.split("대한국") == [("대", None), ("한국", "Hanguk")]
+    assert len(exceptions) == len(ENTRIES)
+
+
+def test_add():
+    exceptions = Exceptions()
+    # Entries are composed, an entry can be replaced
+    exceptions.add(unicodedata.normalize("NFD", "서울"), "Seoul")
+    exceptions.add("서울", "Szöul")
+    assert len(exceptions) == 1
+    assert exceptions.get("서울") == "Szöul"
+    for word in ["", "Seoul", "서울 역", "ㅅ"]:
+        with pytest.raises(ValueError):
+            exceptions.add(word, "x")
+
+
+def test_match_over_jamos():
+    translator = Hangul(exceptions=Exceptions(ENTRIES))
+    # Decomposed 서 (2 characters), precomposed 울, decomposed 에 with the rules
+    word = unicodedata.normalize("NFD", "서") + "울" + unicodedata.normalize("NFD", "에")
+    assert translator.match_exceptions(word) == [
+        ("Szöul", None, [3]), (word[3:], [11, 5, 0], [2])]
+    # Compatibility jamos, an entry after a syllable transliterated with the rules
+    assert translator.match_exceptions("ㅇㅏㅅㅓㅇㅜㄹ") == [("ㅇㅏ", [11, 0, 0], [2]), ("Szöul", None, [5])]
+    # A jamo on its own is kept, the entries are matched on both sides of it
+    assert translator.match_exceptions("서울ㅋ한국") == [
+        ("Szöul", None, [2]), ("ㅋ", None, None), ("Hanguk", None, [2])]
+    assert translator.match_exceptions("ㅎㅏㄴ") is None
+    assert translator.transliterate_text("ㅅㅓㅇㅜㄹ ㅇㅔ") == translator.transliterate_text("서울 에")
+
+
+def test_alignment():
+    translator = Hangul(exceptions=Exceptions(ENTRIES))
+    words = list(ENTRIES) + ["안녕", "에서", "한국어", "ㅋ"]
+    rng = random.Random(0)
+    for _ in range(500):
+        text = " ".join("".join(rng.choice(words) for _ in range(rng.randint(1, 3))) for _ in range(rng.randint(1, 4)))
+        text = "".join(unicodedata.normalize("NFD", character) if rng.random() < 0.3 else character for character in text)
+        output, alignment = translator.transliterate_text(text, alignment=True)
+        assert output == translator.transliterate_text(text)
+        assert output == translator.transliterate_text(unicodedata.normalize("NFC", text))
+        assert alignment.sources[-1] == len(text) and alignment.outputs[-1] == len(output)
+    # An entry maps as a whole, to all the characters of its syllables
+    output, alignment = translator.transliterate_text("국어 " + unicodedata.normalize("NFD", "서울"), alignment=True)
+    assert output == "X Szöul"
+    assert alignment.output_span(1) == (0, 1)
+    assert [alignment.output_span(offset) for offset in range(3, 7)] == [(2, 7)] * 4
+    assert alignment.source_offset(6) == 3
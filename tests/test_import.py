@@ -0,0 +1,53 @@
+"""
+Importing the package must stay cheap: no tables are built and the modules pulling in
+multiprocessing, sockets, memory-mapped files or JSON are only imported when their names are used.
+"""
+import os
+import subprocess
+import sys
+
+import hangul_hu
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Cumulative import time of hangul_hu in seconds (python -X importtime), the best of RUNS cold imports.
+# About 20 ms here, importing the heavy modules again takes it over 40 ms
+BUDGET = 0.04
+RUNS = 7
+HEAVY = ["multiprocessing", "concurrent.futures", "socket", "asyncio", "logging", "json", "hangul_hu.parallel",
+         "hangul_hu.index", "hangul_hu.schemes", "hangul_hu.incremental"]
+
+
+def run(code, *options):
+    return subprocess.run([sys.executable, *options, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+
+
+def test_import_time():
+    times = []
+    for _ in range(RUNS):
+        lines = run("import hangul_hu", "-X", "importtime").stderr.splitlines()
+        # import time: self [us] | cumulative | imported package
+        times.append(int(lines[-1].split("|")[1]) / 1e6)
+    assert min(times) < BUDGET, "import hangul_hu took {:.1f} ms".format(min(times) * 1000)
+
+
+def test_no_heavy_modules():
+    loaded = run("import sys, hangul_hu; print(' '.join(sys.modules))").stdout.split()
+    assert [module for module in HEAVY if module in loaded] == []
+
+
+def test_cli_no_heavy_modules():
+    # The modules of --jobs, --bulk, --serve-stdio and --profile are imported when these options are given
+    loaded = run("import sys, hangul_hu.cli; print(' '.join(sys.modules))").stdout.split()
+    heavy = [module for module in HEAVY if module not in ("hangul_hu.schemes",)]
+    heavy += ["hangul_hu.bulk", "hangul_hu.stdio", "hangul_hu.profiling"]
+    assert [module for module in heavy if module in loaded] == []
+
+
+def test_no_tables():
+    assert run("import hangul_hu; print(hangul_hu.Hangul.vowel_table)").stdout.strip() == "None"
+
+
+def test_lazy_names():
+    for name in hangul_hu.__all__:
+        assert getattr(hangul_hu, name) is not None
+    assert "SearchIndex" in dir(hangul_hu)
@@ -0,0 +1,100 @@
+"""
+IncrementalTransliteration keeps the transliteration of the whole document after every edit,
+and BlockOffsets finds the blocks like a linear scan over their lengths.
+"""
+import random
+
+import pytest
+
+from hangul_hu import Hangul, IncrementalTransliteration
+from hangul_hu.incremental import BlockOffsets
+
+WORDS = ["안녕하세요", "서울", "한국어", "abc", "닭", " ", " ", ", ", "\n"]
+
+
+def scan(lengths, offset):
+    """ find of BlockOffsets with a linear scan. """
+    start = 0
+    for index, length in enumerate(lengths):
+        if start + length >= offset:
+            return index, start
+        start += length
+    if not lengths:
+        return 0, 0
+    return len(lengths) - 1, start - lengths[-1]
+
+
+def check(document):
+    assert document.transliteration == Hangul().transliterate_text(document.text)
+    assert [document.offsets.length(index) for index in range(len(document.blocks))] == \
+        [len(block) for block in document.blocks]
+    # Blocks end outside Korean words
+    is_korean = document.translator.is_character_korean
+    for block, following in zip(document.blocks, document.blocks[1:]):
+        assert not (is_korean(block[-1]) and is_korean(following[0]))
+
+
+def test_block_offsets():
+    rng = random.Random(0)
+    for count in range(0, 20):
+        lengths = [rng.randint(0, 5) for _ in range(count)]
+        offsets = BlockOffsets(lengths)
+        for _ in range(10):
+            for offset in range(sum(lengths) + 3):
+                assert offsets.find(offset) == scan(lengths, offset)
+            assert [offsets.length(index) for index in range(count)] == lengths
+            if count:
+                index = rng.randrange(count)
+                delta = rng.randint(-lengths[index], 5)
+                lengths[index] += delta
+                offsets.add(index, delta)
+
+
+def test_empty_document():
+    document = IncrementalTransliteration()
+    assert document.text == document.transliteration == ""
+    assert document.find_block(0) == (0, 0)
+    document.insert(0, "안녕")
+    assert document.transliteration == "ánnjang"
+    document.delete(0, 2)
+    assert document.text == document.transliteration == ""
+    with pytest.raises(IndexError):
+        document.insert(1, "a")
+
+
+def test_edit_at_the_end():
+    text = "안녕하세요 " * 200
+    document = IncrementalTransliteration(text)
+    document.insert(len(text), "서울")
+    document.insert(len(document.text), "역")
+    check(document)
+    with pytest.raises(IndexError):
+        document.delete(len(document.text), 1)
+    with pytest.raises(IndexError):
+        document.insert(len(document.text) + 1, "a")
+
+
+def test_merged_korean_runs():
+    # Removing the spaces between the runs makes Korean words across the blocks
+    document = IncrementalTransliteration(" ".join(["안녕하세요" * 10] * 30))
+    assert len(document.blocks) > 4
+    while " " in document.text:
+        document.delete(document.text.index(" "))
+        check(document)
+    assert len(document.blocks) == 1
+    # And splitting the word again
+    for offset in range(100, len(document.text), 100):
+        document.insert(offset, " ")
+        check(document)
+
+
+def test_random_edits():
+    rng = random.Random(1)
+    document = IncrementalTransliteration("".join(rng.choice(WORDS) for _ in range(300)))
+    for _ in range(1000):
+        length = len(document.text)
+        offset = rng.randint(0, length)
+        removed = rng.randint(0, min(length - offset, 20)) if rng.random() < 0.5 else 0
+        document.edit(offset, removed, "".join(rng.choice(WORDS) for _ in range(rng.randint(0, 3))))
+        assert document.transliteration == Hangul().transliterate_text(document.text)
+    check(document)
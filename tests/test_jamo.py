@@ -0,0 +1,61 @@
+"""
+Conjoining jamos (NFD text) and compatibility jamos are composed into syllables while transliterating,
+the text is transliterated like its precomposed form and the alignment points back into the jamos.
+"""
+import random
+import unicodedata
+
+from hangul_hu import Hangul
+
+WORDS = ["안녕하세요", "닭", "값이", "서울역", "한국어", "읽다", "없었다", "ㅋㅋ", "괜찮아"]
+
+
+def random_text(rng):
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 5)))
+
+
+def test_compose_syllables():
+    compose = Hangul.compose_syllables
+    assert compose("한글") == [("한글", [18, 0, 4, 0, 18, 8], [1, 1])]
+    # Conjoining jamos, with and without a batchim, and a precomposed syllable followed by a conjoining batchim
+    assert compose("한그") == [("한그", [18, 0, 4, 0, 18, 0], [3, 2])]
+    assert compose("한") == [("한", [18, 0, 4], [2])]
+    # Compatibility jamos: a consonant before a vowel starts the next syllable
+    assert compose("ㅎㅏㄴㄱㅡㄹ") == [("ㅎㅏㄴㄱㅡㄹ", [18, 0, 4, 0, 18, 8], [3, 3])]
+    assert compose("ㅎㅏㄴㅏ") == [("ㅎㅏㄴㅏ", [18, 0, 0, 2, 0, 0], [2, 2])]
+    # Jamos on their own split the run
+    assert compose("ㅋㅋ한") == [("ㅋ", None, None), ("ㅋ", None, None), ("한", [18, 0, 4], [1])]
+    assert compose("한ㅋ글") == [("한", [18, 0, 4], [1]), ("ㅋ", None, None), ("글", [0, 18, 8], [1])]
+
+
+def test_decomposed_text():
+    translator = Hangul()
+    rng = random.Random(0)
+    for _ in range(500):
+        text = random_text(rng)
+        expected = translator.transliterate_text(text)
+        nfd = unicodedata.normalize("NFD", text)
+        mixed = "".join(unicodedata.normalize("NFD", character) if rng.random() < 0.5 else character for character in text)
+        for variant in (nfd, mixed):
+            assert translator.transliterate_text(variant) == expected
+            assert translator.transliterate_text(variant, alignment=True)[0] == expected
+
+
+def test_compatibility_jamos():
+    translator = Hangul()
+    assert translator.transliterate_text("ㅎㅏㄴㄱㅡㄹ") == translator.transliterate_text("한글")
+    assert translator.transliterate_text("ㅇㅏㄴㄴㅕㅇ ㅋㅋ") == translator.transliterate_text("안녕") + " ㅋㅋ"
+    assert translator.transliterate_text("ㅎㅏㄴㄱㅡㄹ", alignment=True)[0] == translator.transliterate_text("한글")
+
+
+def test_alignment_of_jamos():
+    translator = Hangul()
+    # Each syllable maps as a whole even when its transliteration is as long as its jamos
+    output, alignment = translator.transliterate_text("ㅎㅏㄴ a", alignment=True)
+    assert output == "hán a"
+    assert [alignment.output_span(offset) for offset in range(3)] == [(0, 3)] * 3
+    assert [alignment.source_offset(offset) for offset in range(3)] == [0, 0, 0]
+    assert alignment.output_span(4) == (4, 5)
+    output, alignment = translator.transliterate_text("한글", alignment=True)
+    assert output == translator.transliterate_text("한글")
+    assert [alignment.source_offset(offset) for offset in range(len(output))] == [0, 0, 0, 3, 3, 3]
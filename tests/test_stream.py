@@ -0,0 +1,38 @@
+"""
+Text read in chunks is transliterated like the whole text, whichever character a chunk ends at.
+"""
+import os
+import subprocess
+import sys
+
+from hangul_hu import Hangul
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TEXT = "안녕하세요, 서울역은 ㅎㅏㄴ 정말 크다.\n닭은 없다 abc 값이 한국어"
+
+
+def test_every_cut():
+    translator = Hangul()
+    expected = translator.transliterate_text(TEXT)
+    for cut in range(len(TEXT) + 1):
+        assert "".join(translator.transliterate_stream([TEXT[:cut], TEXT[cut:]])) == expected
+
+
+def test_small_chunks():
+    translator = Hangul()
+    for size in range(1, 6):
+        chunks = [TEXT[i:i + size] for i in range(0, len(TEXT), size)]
+        assert "".join(translator.transliterate_stream(chunks)) == translator.transliterate_text(TEXT)
+
+
+def test_no_chunks():
+    assert list(Hangul().transliterate_stream([])) == []
+    assert list(Hangul().transliterate_stream(["", ""])) == []
+
+
+def test_standard_streams():
+    # The standard streams are read and written in UTF-8 whatever the locale, the output is written as it is
+    environment = dict(os.environ, LC_ALL="C", PYTHONIOENCODING="ascii")
+    output = subprocess.run([sys.executable, "-m", "hangul_hu", "-i", "-", "-o", "-"], cwd=ROOT, input=TEXT.encode("utf-8"),
+                            capture_output=True, env=environment, check=True).stdout
+    assert output.decode("utf-8") == Hangul().transliterate_text(TEXT)
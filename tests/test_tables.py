@@ -0,0 +1,87 @@
+"""
+The compiled tables (and the transition table built from them) must give the same output as the rule methods,
+for every jamo, every syllable and every (batchim, leading consonant, vowel) context.
+"""
+from array import array
+
+import pytest
+
+from hangul_hu import Hangul, Syllable
+
+LCount, VCount, TCount = Hangul.LCount, Hangul.VCount, Hangul.TCount
+CONTEXTS = [(t, l, v) for t in range(TCount) for l in range(LCount) for v in range(VCount)]
+
+
+def syllable(l, v, t):
+    return Syllable(Hangul.JLT[l], Hangul.JVT[v], Hangul.JTT_MERGED[t] if t != 0 else None)
+
+
+def reference(word):
+    """ Transliterate a list of Syllable objects with the rule methods, as the program did before the tables. """
+    result = ""
+    for i, current in enumerate(word):
+        if i == 0:
+            result += Hangul.word_initial_consonants_with_vowel(current.leading_consonant, current.vowel)
+        else:
+            result += Hangul.syllable_initial_consonants(word[i - 1].batchim, current.leading_consonant, current.vowel)
+        result += Hangul.transliterate_vowel(current.vowel)
+        if current.batchim is not None:
+            if i == len(word) - 1:
+                result += Hangul.word_final_consonants(current.batchim)
+            else:
+                result += Hangul.syllable_final_consonants(current.batchim, word[i + 1])
+    return result
+
+
+def indices(*syllables):
+    return array("H", [index for s in syllables for index in s])
+
+
+@pytest.fixture(scope="module", autouse=True)
+def tables():
+    Hangul.compile_tables()
+    Hangul.compile_transition_table()
+
+
+def test_jamo_tables():
+    for l, leading_consonant in enumerate(Hangul.JLT):
+        for v, vowel in enumerate(Hangul.JVT):
+            assert Hangul.word_initial_table[l * VCount + v] == \
+                Hangul.word_initial_consonants_with_vowel(leading_consonant, vowel)
+    for v, vowel in enumerate(Hangul.JVT):
+        assert Hangul.vowel_table[v] == Hangul.transliterate_vowel(vowel)
+    assert Hangul.word_final_table[0] == ""
+    for t in range(1, TCount):
+        assert Hangul.word_final_table[t] == Hangul.word_final_consonants(Hangul.JTT_MERGED[t])
+
+
+def test_context_tables():
+    for t, l, v in CONTEXTS:
+        context = (t * LCount + l) * VCount + v
+        batchim = Hangul.JTT_MERGED[t] if t != 0 else None
+        assert Hangul.syllable_initial_table[context] == \
+            Hangul.syllable_initial_consonants(batchim, Hangul.JLT[l], Hangul.JVT[v])
+        expected = "" if t == 0 else Hangul.syllable_final_consonants(batchim, syllable(l, v, 0))
+        assert Hangul.syllable_final_table[context] == expected
+
+
+def test_every_syllable():
+    for SIndex in range(Hangul.SCount):
+        l, v, t = Hangul.syllable_indices[SIndex]
+        assert Hangul.unpack_syllables(chr(Hangul.SBase + SIndex)) == [l, v, t]
+        expected = reference([syllable(l, v, t)])
+        assert Hangul.transliterate_indices(indices((l, v, t))) == expected
+        assert Hangul.transliterate_transitions(indices((l, v, t))) == expected
+
+
+def test_every_context_pair():
+    # Every context is the one between the first and the second, and between the second and the third syllable
+    # of a word, the other jamos go round so that they take every value too
+    for i, (t, l, v) in enumerate(CONTEXTS):
+        first = ((i // TCount) % LCount, i % VCount, t)
+        second = (l, v, t)
+        third = (l, v, i % TCount)
+        for word in [(first, second), (first, second, third)]:
+            expected = reference([syllable(*s) for s in word])
+            assert Hangul.transliterate_indices(indices(*word)) == expected
+            assert Hangul.transliterate_transitions(indices(*word)) == expected